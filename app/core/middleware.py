@@ -25,6 +25,10 @@ PUBLIC_PATHS: set[str] = {
     "/api/auth/refresh",
 }
 
+# Resolved once at import instead of per request.
+_SECRET_KEY = settings.auth.secret_key.get_secret_value()
+_ALGORITHMS = [settings.auth.algorithm]
+
 
 class AuthMiddleware:
     """Pure ASGI middleware for JWT validation (SSE-compatible)."""
@@ -58,11 +62,11 @@ class AuthMiddleware:
             return
 
         token = auth_header[7:]
-        secret = settings.auth.secret_key.get_secret_value()
-        algorithm = settings.auth.algorithm
 
         try:
-            payload: dict[str, Any] = jwt.decode(token, secret, algorithms=[algorithm])
+            payload: dict[str, Any] = jwt.decode(
+                token, _SECRET_KEY, algorithms=_ALGORITHMS
+            )
         except jwt.ExpiredSignatureError:
             await self._send_error(send, 401, "TOKEN_EXPIRED", "Token has expired")
             return
@@ -76,8 +80,7 @@ class AuthMiddleware:
 
         jti = payload.get("jti", "")
         if redis_client is not None:
-            is_blacklisted = await redis_client.get(f"{BLACKLIST_PREFIX}{jti}")
-            if is_blacklisted is not None:
+            if await redis_client.exists(f"{BLACKLIST_PREFIX}{jti}"):
                 await self._send_error(
                     send, 401, "TOKEN_BLACKLISTED", "Token has been revoked"
                 )
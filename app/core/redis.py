@@ -4,13 +4,21 @@ import redis.asyncio as redis
 
 from app.core.config import settings
 
+REDIS_MAX_CONNECTIONS = 64
+
 redis_client: redis.Redis | None = None  # type: ignore[type-arg]
 
 
 async def init_redis() -> redis.Redis:  # type: ignore[type-arg]
     """Initialize the Redis connection."""
     global redis_client  # noqa: PLW0603
-    redis_client = redis.from_url(settings.redis.url, decode_responses=True)
+    pool = redis.ConnectionPool.from_url(
+        settings.redis.url,
+        max_connections=REDIS_MAX_CONNECTIONS,
+        # Replies are tiny ("1", counters); keep them as bytes.
+        decode_responses=False,
+    )
+    redis_client = redis.Redis(connection_pool=pool)
     await redis_client.ping()
     return redis_client
 
@@ -19,7 +27,7 @@ async def close_redis() -> None:
     """Close the Redis connection."""
     global redis_client  # noqa: PLW0603
     if redis_client:
-        await redis_client.aclose()
+        await redis_client.aclose(close_connection_pool=True)
         redis_client = None
 
 
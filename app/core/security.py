@@ -1,28 +1,47 @@
 """Password hashing utilities using bcrypt."""
 
 import asyncio
+import functools
 from concurrent.futures import ThreadPoolExecutor
 
 import bcrypt
 
+BCRYPT_ROUNDS = 12
+
 _executor = ThreadPoolExecutor(max_workers=4)
 
-DUMMY_HASH = bcrypt.hashpw(b"dummy", bcrypt.gensalt(rounds=12)).decode()
+
+@functools.cache
+def _dummy_hash_for(rounds: int) -> str:
+    """Blocking bcrypt hash of a throwaway secret, cached per cost factor."""
+    return bcrypt.hashpw(b"dummy", bcrypt.gensalt(rounds)).decode()
+
+
+def dummy_hash() -> str:
+    """Hash to verify against for unknown users, built on first use.
+
+    Uses the current ``BCRYPT_ROUNDS`` so the check costs the same as a real one.
+    """
+    return _dummy_hash_for(BCRYPT_ROUNDS)
+
+
+def _hash(password: str) -> str:
+    """Blocking bcrypt hash; runs on the executor."""
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(BCRYPT_ROUNDS)).decode()
+
+
+def _verify(plain: str, hashed: str) -> bool:
+    """Blocking bcrypt check; runs on the executor."""
+    return bcrypt.checkpw(plain.encode(), hashed.encode())
 
 
 async def hash_password(password: str) -> str:
     """Hash a password using bcrypt."""
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(
-        _executor,
-        lambda: bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=12)).decode(),
-    )
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, _hash, password)
 
 
 async def verify_password(plain: str, hashed: str) -> bool:
     """Verify a password against a bcrypt hash."""
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(
-        _executor,
-        lambda: bcrypt.checkpw(plain.encode(), hashed.encode()),
-    )
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, _verify, plain, hashed)
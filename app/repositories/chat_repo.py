@@ -2,15 +2,16 @@
 
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy import and_, delete, or_, select, update
+from sqlalchemy import and_, delete, insert, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.chat_message import ChatMessage
 from app.models.chat_session import ChatSession
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SessionWithPreview:
     """Immutable result object for session list queries."""
 
@@ -37,6 +38,28 @@ class ChatRepository:
         )
         return result.scalar_one_or_none()
 
+    async def find_session_with_messages(
+        self, conversation_id: str
+    ) -> tuple[ChatSession | None, list[ChatMessage]]:
+        """Fetch a session and its messages (chronological) in one round-trip.
+
+        Uses a LEFT OUTER JOIN so a session without messages is still returned.
+        Returns ``(None, [])`` when the conversation does not exist.
+        """
+        result = await self._session.execute(
+            select(ChatSession, ChatMessage)
+            .outerjoin(ChatMessage, ChatMessage.session_id == ChatSession.id)
+            .where(ChatSession.conversation_id == conversation_id)
+            .order_by(ChatMessage.id.asc())
+        )
+        session: ChatSession | None = None
+        messages: list[ChatMessage] = []
+        for chat_session, message in result:
+            session = chat_session
+            if message is not None:
+                messages.append(message)
+        return session, messages
+
     async def create_session(
         self,
         user_id: int,
@@ -91,6 +114,16 @@ class ChatRepository:
         self._session.add_all(messages)
         await self._session.flush()
 
+    async def insert_messages_bulk(self, rows: list[dict[str, Any]]) -> None:
+        """Insert message rows with a single Core executemany.
+
+        Skips ORM object construction and identity-map bookkeeping; use
+        ``create_messages_bulk`` instead when the generated IDs are needed.
+        """
+        if not rows:
+            return
+        await self._session.execute(insert(ChatMessage), rows)
+
     async def find_sessions_by_user(
         self,
         user_id: int,
@@ -39,6 +39,8 @@ SYSTEM_PROMPT_TEMPLATE = (
     "or any time-relative query, use this date to provide accurate information."
 )
 
+TOOL_RESULT_MAX_CHARS = 500
+
 
 class AgentService:
     """Service for managing LangGraph ReAct agent interactions."""
@@ -67,10 +69,11 @@ class AgentService:
         Returns:
             Tuple of (ChatResponse, is_new_session).
         """
-        conversation_id = request.conversation_id or str(uuid.uuid4())
+        conversation_id = request.conversation_id or uuid.uuid4().hex
 
-        session, is_new = await self._get_or_create_session(conversation_id)
-        history = await self._load_history(session.id)
+        session, is_new, history = await self._get_or_create_session_with_history(
+            conversation_id
+        )
 
         config: RunnableConfig = {
             "configurable": {"thread_id": conversation_id},
@@ -86,7 +89,9 @@ class AgentService:
         all_messages = response.get("messages", [])
         new_messages = self._extract_new_messages(all_messages, len(history))
 
-        await self._save_messages(session.id, request.message, new_messages)
+        await self._chat_repo.insert_messages_bulk(
+            self._build_message_rows(session.id, request.message, new_messages)
+        )
 
         ai_message = self._extract_last_ai_message(all_messages)
         sources = self._extract_sources(all_messages)
@@ -109,10 +114,11 @@ class AgentService:
         Yields:
             StreamEvent objects for each streaming event.
         """
-        conversation_id = request.conversation_id or str(uuid.uuid4())
+        conversation_id = request.conversation_id or uuid.uuid4().hex
 
-        session, is_new = await self._get_or_create_session(conversation_id)
-        history = await self._load_history(session.id)
+        session, is_new, history = await self._get_or_create_session_with_history(
+            conversation_id
+        )
 
         config: RunnableConfig = {
             "configurable": {"thread_id": conversation_id},
@@ -304,16 +310,25 @@ class AgentService:
 
         return session, message
 
-    async def _get_or_create_session(self, conversation_id: str) -> tuple[Any, bool]:
-        """Find existing session or create a new one."""
-        session = await self._chat_repo.find_session_by_conversation_id(conversation_id)
+    async def _get_or_create_session_with_history(
+        self, conversation_id: str
+    ) -> tuple[Any, bool, list[BaseMessage]]:
+        """Find existing session with its history, or create a new one.
+
+        The session row and its messages are fetched in a single query so
+        that non-first chat turns pay one DB round-trip instead of two.
+        """
+        session, db_messages = await self._chat_repo.find_session_with_messages(
+            conversation_id
+        )
         if session:
-            return session, False
+            messages = self._build_langchain_messages(db_messages)
+            return session, False, self._sanitize_message_sequence(messages)
         session = await self._chat_repo.create_session(
             user_id=self._user_id,
             conversation_id=conversation_id,
         )
-        return session, True
+        return session, True, []
 
     async def _load_history(self, session_id: int) -> list[BaseMessage]:
         """Load previous messages from DB and convert to LangChain format."""
@@ -329,23 +344,9 @@ class AgentService:
     ) -> list[ChatMessage]:
         """Save user message and agent response messages to DB."""
         records = [
-            ChatMessage(
-                session_id=session_id,
-                role="human",
-                content=user_message,
-            )
+            ChatMessage(**row)
+            for row in self._build_message_rows(session_id, user_message, new_messages)
         ]
-        for msg in new_messages:
-            records.append(
-                ChatMessage(
-                    session_id=session_id,
-                    role=msg["role"],
-                    content=msg.get("content", ""),
-                    tool_calls_json=msg.get("tool_calls_json"),
-                    tool_call_id=msg.get("tool_call_id"),
-                    tool_name=msg.get("tool_name"),
-                )
-            )
         await self._chat_repo.create_messages_bulk(records)
         return records
 
@@ -355,21 +356,49 @@ class AgentService:
         new_messages: list[dict[str, Any]],
     ) -> list[ChatMessage]:
         """Save only AI/tool messages to DB (no human message)."""
-        records: list[ChatMessage] = []
-        for msg in new_messages:
-            records.append(
-                ChatMessage(
-                    session_id=session_id,
-                    role=msg["role"],
-                    content=msg.get("content", ""),
-                    tool_calls_json=msg.get("tool_calls_json"),
-                    tool_call_id=msg.get("tool_call_id"),
-                    tool_name=msg.get("tool_name"),
-                )
-            )
+        records = [
+            ChatMessage(**row)
+            for row in self._build_message_rows(session_id, None, new_messages)
+        ]
         await self._chat_repo.create_messages_bulk(records)
         return records
 
+    @staticmethod
+    def _build_message_rows(
+        session_id: int,
+        user_message: str | None,
+        new_messages: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Build column mappings for the user message and agent responses.
+
+        Every row carries the same keys so it can be used for an executemany
+        insert as well as for ``ChatMessage(**row)``.
+        """
+        rows: list[dict[str, Any]] = []
+        if user_message is not None:
+            rows.append(
+                {
+                    "session_id": session_id,
+                    "role": "human",
+                    "content": user_message,
+                    "tool_calls_json": None,
+                    "tool_call_id": None,
+                    "tool_name": None,
+                }
+            )
+        for msg in new_messages:
+            rows.append(
+                {
+                    "session_id": session_id,
+                    "role": msg["role"],
+                    "content": msg.get("content", ""),
+                    "tool_calls_json": msg.get("tool_calls_json"),
+                    "tool_call_id": msg.get("tool_call_id"),
+                    "tool_name": msg.get("tool_name"),
+                }
+            )
+        return rows
+
     async def _find_last_human_message_id(self, session_id: int) -> int | None:
         """Find the ID of the last human message in a session."""
         db_messages = await self._chat_repo.find_messages_by_session_id(session_id)
@@ -543,7 +572,11 @@ class AgentService:
 
         elif event_type == "on_tool_end":
             output = event.get("data", {}).get("output", "")
-            truncated = str(output)[:500]
+            # Slice str outputs directly; only stringify non-str payloads.
+            if isinstance(output, str):
+                truncated = output[:TOOL_RESULT_MAX_CHARS]
+            else:
+                truncated = str(output)[:TOOL_RESULT_MAX_CHARS]
             return StreamEvent(event="tool_result", data=truncated)
 
         return None
@@ -12,7 +12,7 @@ from app.core.exceptions import (
     TokenBlacklistedError,
     UserAlreadyExistsError,
 )
-from app.core.security import DUMMY_HASH, hash_password, verify_password
+from app.core.security import dummy_hash, hash_password, verify_password
 from app.repositories.user_repo import UserRepository
 from app.schemas.auth_schema import (
     LoginRequest,
@@ -73,7 +73,7 @@ class AuthService:
         user = await self._user_repo.find_by_email(request.email)
 
         if user is None:
-            await verify_password(request.password, DUMMY_HASH)
+            await verify_password(request.password, dummy_hash())
             await self._token_service.record_failed_login(request.email)
             raise InvalidCredentialsError
 
@@ -120,10 +120,15 @@ class AuthService:
         if payload.type != "refresh":
             raise InvalidTokenError
 
-        if await self._token_service.is_blacklisted(payload.jti):
+        blacklisted, locked = await self._token_service.check_and_lock_refresh(
+            payload.jti
+        )
+        if blacklisted:
+            if locked:
+                await self._token_service.release_refresh_lock(payload.jti)
             raise TokenBlacklistedError
 
-        if not await self._token_service.acquire_refresh_lock(payload.jti):
+        if not locked:
             raise InvalidTokenError
 
         try:
@@ -1,8 +1,8 @@
 """Service layer for conversation list with cursor-based pagination."""
 
 import base64
-import json
-from datetime import UTC, datetime
+import struct
+from datetime import UTC, datetime, timedelta
 
 from app.core.exceptions import AppException, AuthorizationError, SessionNotFoundError
 from app.repositories.chat_repo import ChatRepository
@@ -13,23 +13,32 @@ from app.schemas.conversation_schema import (
     MessageResponse,
 )
 
+# Cursor payload: epoch microseconds of updated_at + session id, big-endian.
+_CURSOR_STRUCT = struct.Struct(">qq")
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
 
 def encode_cursor(updated_at: datetime, session_id: int) -> str:
-    """Encode pagination cursor as base64url JSON."""
-    payload = {"u": updated_at.isoformat(), "i": session_id}
-    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+    """Encode pagination cursor as unpadded base64url of two packed int64s.
+
+    Naive datetimes are treated as UTC, matching how they are stored.
+    """
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=UTC)
+    ts_us = (updated_at - _EPOCH) // _MICROSECOND
+    payload = _CURSOR_STRUCT.pack(ts_us, session_id)
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode("ascii")
 
 
 def decode_cursor(cursor: str) -> tuple[datetime, int]:
     """Decode pagination cursor. Raises AppException on invalid input."""
     try:
-        raw = base64.urlsafe_b64decode(cursor.encode())
-        data = json.loads(raw)
-        updated_at = datetime.fromisoformat(data["u"])
-        if updated_at.tzinfo is None:
-            updated_at = updated_at.replace(tzinfo=UTC)
-        session_id = int(data["i"])
-        return updated_at, session_id
+        raw = cursor.encode("ascii")
+        raw += b"=" * (-len(raw) % 4)
+        payload = base64.b64decode(raw, altchars=b"-_", validate=True)
+        ts_us, session_id = _CURSOR_STRUCT.unpack(payload)
+        return _EPOCH + ts_us * _MICROSECOND, session_id
     except Exception as exc:
         raise AppException(
             message=f"Invalid cursor: {exc}",
@@ -96,8 +105,9 @@ class ConversationService:
             last = page_rows[-1]
             next_cursor = encode_cursor(last.updated_at, last.id)
 
+        # Rows come straight from our own typed query; skip re-validation.
         conversations = [
-            ConversationSummary(
+            ConversationSummary.model_construct(
                 conversation_id=r.conversation_id,
                 title=r.title,
                 last_message_preview=r.last_message_preview,
@@ -107,7 +117,7 @@ class ConversationService:
             for r in page_rows
         ]
 
-        return ConversationListResponse(
+        return ConversationListResponse.model_construct(
             conversations=conversations,
             next_cursor=next_cursor,
             has_next=has_next,
@@ -1,20 +1,31 @@
 """Service for generating chat session titles via LLM."""
 
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import HumanMessage, SystemMessage
+
+TITLE_MAX_CHARS = 20
+# Hard stop on the provider side; 20 Korean characters fit well within this.
+TITLE_MAX_TOKENS = 48
+
+# Fixed instruction built once; kept as a separate system message so the
+# provider sees an identical prefix on every call.
+_TITLE_INSTRUCTION = SystemMessage(
+    content=(
+        f"다음 사용자 질문을 {TITLE_MAX_CHARS}자 이내의 한국어 제목으로 요약해. "
+        "제목만 출력해."
+    )
+)
 
 
 class TitleService:
     """Generates concise session titles from user messages."""
 
     def __init__(self, llm: BaseChatModel) -> None:
-        self._llm = llm
+        self._llm = llm.bind(max_tokens=TITLE_MAX_TOKENS)
 
     async def generate_title(self, message: str) -> str:
         """Summarise a user message into a title of at most 20 characters."""
-        prompt = (
-            "다음 사용자 질문을 20자 이내의 한국어 제목으로 요약해. "
-            "제목만 출력해:\n"
-            f"{message}"
+        response = await self._llm.ainvoke(
+            [_TITLE_INSTRUCTION, HumanMessage(content=message)]
         )
-        response = await self._llm.ainvoke(prompt)
-        return str(response.content).strip()[:20]
+        return str(response.content).strip()[:TITLE_MAX_CHARS]
@@ -1,7 +1,7 @@
 """JWT token creation, validation, and blacklist management."""
 
+import time
 import uuid
-from datetime import UTC, datetime, timedelta
 
 import jwt
 import redis.asyncio as redis
@@ -19,6 +19,14 @@ REFRESH_LOCK_PREFIX = "refresh_lock:"
 
 MAX_LOGIN_ATTEMPTS = 5
 LOGIN_LOCKOUT_SECONDS = 300
+REFRESH_LOCK_SECONDS = 10
+
+# Resolved once at import: settings are immutable for the process lifetime.
+_SECRET_KEY = settings.auth.secret_key.get_secret_value()
+_ALGORITHM = settings.auth.algorithm
+_ALGORITHMS = [_ALGORITHM]
+_ACCESS_TOKEN_TTL_SECONDS = settings.auth.access_token_expire_minutes * 60
+_REFRESH_TOKEN_TTL_SECONDS = settings.auth.refresh_token_expire_days * 86400
 
 
 class TokenService:
@@ -26,43 +34,41 @@ class TokenService:
 
     def __init__(self, redis_client: redis.Redis) -> None:  # type: ignore[type-arg]
         self._redis = redis_client
-        self._secret = settings.auth.secret_key.get_secret_value()
-        self._algorithm = settings.auth.algorithm
 
     def create_access_token(self, user_id: int, email: str, role: str) -> str:
         """Create a signed JWT access token."""
-        now = datetime.now(UTC)
-        expire = now + timedelta(minutes=settings.auth.access_token_expire_minutes)
+        now = int(time.time())
+        expire = now + _ACCESS_TOKEN_TTL_SECONDS
         payload = {
             "sub": str(user_id),
             "email": email,
             "role": role,
             "type": "access",
-            "jti": str(uuid.uuid4()),
+            "jti": uuid.uuid4().hex,
             "iat": now,
             "exp": expire,
         }
-        return jwt.encode(payload, self._secret, algorithm=self._algorithm)
+        return jwt.encode(payload, _SECRET_KEY, algorithm=_ALGORITHM)
 
     def create_refresh_token(self, user_id: int, email: str, role: str) -> str:
         """Create a signed JWT refresh token."""
-        now = datetime.now(UTC)
-        expire = now + timedelta(days=settings.auth.refresh_token_expire_days)
+        now = int(time.time())
+        expire = now + _REFRESH_TOKEN_TTL_SECONDS
         payload = {
             "sub": str(user_id),
             "email": email,
             "role": role,
             "type": "refresh",
-            "jti": str(uuid.uuid4()),
+            "jti": uuid.uuid4().hex,
             "iat": now,
             "exp": expire,
         }
-        return jwt.encode(payload, self._secret, algorithm=self._algorithm)
+        return jwt.encode(payload, _SECRET_KEY, algorithm=_ALGORITHM)
 
     def decode_token(self, token: str) -> TokenPayload:
         """Decode and validate a JWT token."""
         try:
-            payload = jwt.decode(token, self._secret, algorithms=[self._algorithm])
+            payload = jwt.decode(token, _SECRET_KEY, algorithms=_ALGORITHMS)
         except jwt.ExpiredSignatureError as e:
             raise TokenExpiredError from e
         except jwt.InvalidTokenError as e:
@@ -81,23 +87,24 @@ class TokenService:
 
     async def blacklist_token(self, jti: str, exp: int) -> None:
         """Add a token to the blacklist until it expires."""
-        ttl = exp - int(datetime.now(UTC).timestamp())
+        ttl = exp - int(time.time())
         if ttl > 0:
             await self._redis.setex(f"{BLACKLIST_PREFIX}{jti}", ttl, "1")
 
     async def is_blacklisted(self, jti: str) -> bool:
         """Check if a token is blacklisted."""
-        result = await self._redis.get(f"{BLACKLIST_PREFIX}{jti}")
-        return result is not None
+        return bool(await self._redis.exists(f"{BLACKLIST_PREFIX}{jti}"))
 
     # --- Login attempts ---
 
     async def record_failed_login(self, email: str) -> int:
         """Record a failed login attempt, return total count."""
         key = f"{LOGIN_ATTEMPTS_PREFIX}{email}"
-        count = await self._redis.incr(key)
-        if count == 1:
-            await self._redis.expire(key, LOGIN_LOCKOUT_SECONDS)
+        # Single round-trip; NX keeps the lockout window anchored at the first failure.
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.incr(key)
+            pipe.expire(key, LOGIN_LOCKOUT_SECONDS, nx=True)
+            count, _ = await pipe.execute()
         return int(count)
 
     async def reset_login_attempts(self, email: str) -> None:
@@ -114,7 +121,21 @@ class TokenService:
     async def acquire_refresh_lock(self, jti: str) -> bool:
         """Acquire a lock for refresh token to prevent concurrent use."""
         key = f"{REFRESH_LOCK_PREFIX}{jti}"
-        return bool(await self._redis.set(key, "1", ex=10, nx=True))
+        return bool(await self._redis.set(key, "1", ex=REFRESH_LOCK_SECONDS, nx=True))
+
+    async def check_and_lock_refresh(self, jti: str) -> tuple[bool, bool]:
+        """Return (is_blacklisted, lock_acquired) for a refresh in one round-trip.
+
+        The lock is attempted even when the token is blacklisted; callers
+        should release it in that case.
+        """
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.exists(f"{BLACKLIST_PREFIX}{jti}")
+            pipe.set(
+                f"{REFRESH_LOCK_PREFIX}{jti}", "1", ex=REFRESH_LOCK_SECONDS, nx=True
+            )
+            blacklisted, acquired = await pipe.execute()
+        return bool(blacklisted), bool(acquired)
 
     async def release_refresh_lock(self, jti: str) -> None:
         """Release the refresh lock."""
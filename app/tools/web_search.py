@@ -1,9 +1,17 @@
 """Web search tool using DuckDuckGo."""
 
+from functools import lru_cache
+
 from langchain_community.tools import DuckDuckGoSearchResults
 from langchain_core.tools import tool
 
 
+@lru_cache(maxsize=1)
+def _get_search() -> DuckDuckGoSearchResults:
+    """Build the DuckDuckGo search tool once and reuse it across calls."""
+    return DuckDuckGoSearchResults(num_results=5)
+
+
 @tool
 def web_search(query: str) -> str:
     """Search the web for current information.
@@ -17,6 +25,5 @@ def web_search(query: str) -> str:
     Returns:
         Search results containing snippets, titles, and links.
     """
-    search = DuckDuckGoSearchResults(num_results=5)
-    result = search.invoke(query)
+    result = _get_search().invoke(query)
     return str(result)
@@ -22,10 +22,11 @@ async def create_admin(email: str, password: str, username: str) -> None:
 
     async with async_session_factory() as session:
         session: AsyncSession
-        result = await session.execute(select(User).where(User.email == email))
-        existing = result.scalar_one_or_none()
-        if existing:
-            print(f"User with email '{email}' already exists (id={existing.id}).")
+        existing_id = await session.scalar(
+            select(User.id).where(User.email == email).limit(1)
+        )
+        if existing_id is not None:
+            print(f"User with email '{email}' already exists (id={existing_id}).")
             return
 
         hashed = await hash_password(password)
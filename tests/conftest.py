@@ -1,18 +1,22 @@
 """Pytest configuration and fixtures."""
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Generator
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import fakeredis.aioredis
 import pytest
+from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import AIMessage
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import StaticPool
 
 from app.core.database import Base
 from app.models.chat_message import ChatMessage  # noqa: F401
@@ -22,20 +26,60 @@ from app.services.token_service import TokenService
 
 # --- Test DB (SQLite in-memory) ---
 
-test_engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+# StaticPool keeps the single in-memory connection (and its schema) alive
+# for the whole run. The database is private to the process, so each
+# pytest-xdist worker gets its own copy without any per-worker setup.
+test_engine = create_async_engine(
+    "sqlite+aiosqlite:///:memory:",
+    echo=False,
+    poolclass=StaticPool,
+    connect_args={"check_same_thread": False},
+)
 test_session_factory = async_sessionmaker(
     test_engine, class_=AsyncSession, expire_on_commit=False
 )
 
 
-@pytest.fixture(autouse=True)
+# pysqlite/aiosqlite manage transactions themselves and break SAVEPOINT;
+# hand BEGIN over to SQLAlchemy so nested transactions work.
+@event.listens_for(test_engine.sync_engine, "connect")
+def _disable_driver_transactions(dbapi_connection: Any, _record: Any) -> None:
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(test_engine.sync_engine, "begin")
+def _emit_begin(conn: Any) -> None:
+    conn.exec_driver_sql("BEGIN")
+
+
+@pytest.fixture(scope="session", autouse=True)
 async def setup_db() -> AsyncGenerator[None, None]:
-    """Create all tables before each test, drop after."""
+    """Create all tables once per test run, drop at the end."""
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
+    await test_engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+async def db_transaction(setup_db: None) -> AsyncGenerator[None, None]:
+    """Run each test inside an outer transaction that is rolled back after.
+
+    Every session from ``test_session_factory`` joins that transaction, and
+    its ``commit()`` only releases a SAVEPOINT, so nothing outlives the test.
+    """
+    async with test_engine.connect() as conn:
+        trans = await conn.begin()
+        test_session_factory.configure(
+            bind=conn, join_transaction_mode="create_savepoint"
+        )
+        try:
+            yield
+        finally:
+            test_session_factory.configure(bind=test_engine)
+            await trans.rollback()
 
 
 async def override_get_async_session() -> AsyncGenerator[AsyncSession, None]:
@@ -51,13 +95,19 @@ async def override_get_async_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+@pytest.fixture(autouse=True)
+def fast_password_hashing(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Use bcrypt's minimum cost factor so hashing does not dominate tests."""
+    monkeypatch.setattr("app.core.security.BCRYPT_ROUNDS", 4)
+
+
 # --- Test Redis (fakeredis) ---
 
 
 @pytest.fixture
 def fake_redis() -> fakeredis.aioredis.FakeRedis:
     """Create a fresh fake Redis client."""
-    return fakeredis.aioredis.FakeRedis(decode_responses=True)
+    return fakeredis.aioredis.FakeRedis()
 
 
 @pytest.fixture(autouse=True)
@@ -78,67 +128,85 @@ def token_service(fake_redis: fakeredis.aioredis.FakeRedis) -> TokenService:
     return TokenService(fake_redis)
 
 
+class _MintOnlyRedis:
+    """Redis stand-in for a TokenService that only signs tokens.
+
+    Creating access tokens never touches Redis; any call is a test bug.
+    """
+
+    def __getattr__(self, name: str) -> Any:
+        raise AssertionError(f"token minting must not use Redis (called {name!r})")
+
+
+_TOKEN_SIGNER = TokenService(_MintOnlyRedis())  # type: ignore[arg-type]
+
+
 def make_auth_headers(
-    fake_redis: fakeredis.aioredis.FakeRedis,
     user_id: int = 1,
     email: str = "test@test.com",
     role: str = "user",
 ) -> dict[str, str]:
     """Generate Authorization headers with a valid access token."""
-    ts = TokenService(fake_redis)
-    token = ts.create_access_token(user_id=user_id, email=email, role=role)
+    token = _TOKEN_SIGNER.create_access_token(user_id=user_id, email=email, role=role)
     return {"Authorization": f"Bearer {token}"}
 
 
 # --- App override & client fixtures ---
 
 
-def _get_app():  # type: ignore[no-untyped-def]
-    """Import app lazily and apply overrides."""
+@pytest.fixture(scope="session")
+def app() -> Generator[FastAPI, None, None]:
+    """Import the app once and install the test DB override for the run.
+
+    Per-test fixtures must pop only the overrides they add, never ``clear()``.
+    """
     from app.core.database import get_async_session as original_dep
-    from app.main import app
+    from app.main import app as _app
 
-    app.dependency_overrides[original_dep] = override_get_async_session
-    return app
+    _app.dependency_overrides[original_dep] = override_get_async_session
+    yield _app
+    _app.dependency_overrides.pop(original_dep, None)
 
 
-@pytest.fixture
-async def async_client(
-    fake_redis: fakeredis.aioredis.FakeRedis,
-) -> AsyncGenerator[AsyncClient, None]:
-    """Create an async test client for async tests."""
-    application = _get_app()
-    transport = ASGITransport(app=application)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+@pytest.fixture(scope="session")
+async def shared_client(app: FastAPI) -> AsyncGenerator[AsyncClient, None]:
+    """One AsyncClient for the whole run; per-test fixtures swap its headers."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
         yield ac
 
 
+def use_client(
+    client: AsyncClient, headers: dict[str, str] | None = None
+) -> Generator[AsyncClient, None, None]:
+    """Yield ``client`` with ``headers`` applied, restoring a clean state after."""
+    if headers:
+        client.headers.update(headers)
+    try:
+        yield client
+    finally:
+        for key in headers or {}:
+            client.headers.pop(key, None)
+        client.cookies.clear()
+
+
 @pytest.fixture
-async def authed_client(
-    fake_redis: fakeredis.aioredis.FakeRedis,
-) -> AsyncGenerator[AsyncClient, None]:
-    """Create an async test client with auth headers."""
-    application = _get_app()
-    headers = make_auth_headers(fake_redis)
-    transport = ASGITransport(app=application)
-    async with AsyncClient(
-        transport=transport, base_url="http://test", headers=headers
-    ) as ac:
-        yield ac
+def async_client(shared_client: AsyncClient) -> Generator[AsyncClient, None, None]:
+    """Unauthenticated test client."""
+    yield from use_client(shared_client)
 
 
 @pytest.fixture
-async def admin_client(
-    fake_redis: fakeredis.aioredis.FakeRedis,
-) -> AsyncGenerator[AsyncClient, None]:
-    """Create an async test client with admin auth headers."""
-    application = _get_app()
-    headers = make_auth_headers(fake_redis, role="admin")
-    transport = ASGITransport(app=application)
-    async with AsyncClient(
-        transport=transport, base_url="http://test", headers=headers
-    ) as ac:
-        yield ac
+def authed_client(shared_client: AsyncClient) -> Generator[AsyncClient, None, None]:
+    """Test client with user auth headers."""
+    yield from use_client(shared_client, make_auth_headers())
+
+
+@pytest.fixture
+def admin_client(shared_client: AsyncClient) -> Generator[AsyncClient, None, None]:
+    """Test client with admin auth headers."""
+    yield from use_client(shared_client, make_auth_headers(role="admin"))
 
 
 # --- DB session for tests ---
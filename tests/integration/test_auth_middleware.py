@@ -58,9 +58,8 @@ class TestProtectedPaths:
     async def test_chat_with_valid_token(
         self,
         async_client: AsyncClient,
-        fake_redis: fakeredis.aioredis.FakeRedis,
     ) -> None:
-        headers = make_auth_headers(fake_redis)
+        headers = make_auth_headers()
         resp = await async_client.post(
             "/api/v1/chat",
             json={"message": "hello"},
@@ -1,59 +1,69 @@
 """Integration tests for chat router."""
 
 import json
-from collections.abc import AsyncGenerator
-from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock
+from collections.abc import AsyncIterator, Generator
+from datetime import UTC, datetime
 
-import fakeredis.aioredis
 import pytest
-from httpx import ASGITransport, AsyncClient
+from fastapi import FastAPI
+from httpx import AsyncClient
 
-from app.core.database import get_async_session
 from app.dependencies import get_agent_service
-from app.schemas.chat_schema import ChatResponse, StreamEvent
-from app.services.agent_service import AgentService
-from tests.conftest import make_auth_headers, override_get_async_session
-
-
-@pytest.fixture
-def mock_agent_service() -> MagicMock:
-    """Create a mock AgentService."""
-    mock = MagicMock(spec=AgentService)
-    mock.chat = AsyncMock(
-        return_value=(
-            ChatResponse(
-                message="Hello! How can I help you?",
-                conversation_id="test-conv-123",
-                session_id=1,
-                sources=[],
-                created_at=datetime.now(),
-            ),
-            True,
-        )
-    )
-
-    async def mock_stream_chat(request):
-        yield StreamEvent(event="token", data="Hello")
-        yield StreamEvent(event="token", data=" world")
-        yield StreamEvent(
-            event="done",
-            data=json.dumps(
-                {
-                    "conversation_id": "test-conv-123",
-                    "session_id": 1,
-                    "is_new_session": True,
-                    "user_message_id": 1,
-                    "ai_message_id": 2,
-                }
-            ),
-        )
-
-    mock.stream_chat = mock_stream_chat
-
-    async def mock_stream_regenerate(conversation_id, message_id):
-        yield StreamEvent(event="token", data="Regenerated")
-        yield StreamEvent(
+from app.schemas.chat_schema import ChatRequest, ChatResponse, StreamEvent
+from tests.conftest import make_auth_headers, use_client
+
+_FIXED_CREATED_AT = datetime(2026, 1, 1, tzinfo=UTC)
+
+# Pre-serialized body for the request most tests send.
+_HELLO_BODY = b'{"message":"Hello"}'
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Known-good canned data: model_construct skips Pydantic validation.
+_CHAT_RESPONSE = ChatResponse.model_construct(
+    message="Hello! How can I help you?",
+    conversation_id="test-conv-123",
+    session_id=1,
+    sources=[],
+    created_at=_FIXED_CREATED_AT,
+)
+
+_STREAM_EVENTS = (
+    StreamEvent.model_construct(event="token", data="Hello"),
+    StreamEvent.model_construct(event="token", data=" world"),
+    StreamEvent.model_construct(
+        event="done",
+        data=json.dumps(
+            {
+                "conversation_id": "test-conv-123",
+                "session_id": 1,
+                "is_new_session": True,
+                "user_message_id": 1,
+                "ai_message_id": 2,
+            }
+        ),
+    ),
+)
+# SSE body the /stream endpoint should emit for _STREAM_EVENTS.
+_EXPECTED_STREAM_SSE = "".join(
+    f"data: {json.dumps(event.model_dump())}\n\n" for event in _STREAM_EVENTS
+)
+
+
+class _StubAgent:
+    """Hand-rolled AgentService stand-in with canned, pre-built responses."""
+
+    async def chat(self, request: ChatRequest) -> tuple[ChatResponse, bool]:
+        return _CHAT_RESPONSE, True
+
+    async def stream_chat(self, request: ChatRequest) -> AsyncIterator[StreamEvent]:
+        for event in _STREAM_EVENTS:
+            yield event
+
+    async def stream_regenerate(
+        self, conversation_id: str, message_id: int
+    ) -> AsyncIterator[StreamEvent]:
+        yield StreamEvent.model_construct(event="token", data="Regenerated")
+        yield StreamEvent.model_construct(
             event="done",
             data=json.dumps(
                 {
@@ -65,11 +75,11 @@ def mock_agent_service() -> MagicMock:
             ),
         )
 
-    mock.stream_regenerate = mock_stream_regenerate
-
-    async def mock_stream_edit(conversation_id, message_id, new_content):
-        yield StreamEvent(event="token", data="Edited response")
-        yield StreamEvent(
+    async def stream_edit(
+        self, conversation_id: str, message_id: int, new_content: str
+    ) -> AsyncIterator[StreamEvent]:
+        yield StreamEvent.model_construct(event="token", data="Edited response")
+        yield StreamEvent.model_construct(
             event="done",
             data=json.dumps(
                 {
@@ -81,70 +91,48 @@ def mock_agent_service() -> MagicMock:
             ),
         )
 
-    mock.stream_edit = mock_stream_edit
 
-    return mock
+@pytest.fixture
+def mock_agent_service() -> _StubAgent:
+    """Create a stub AgentService."""
+    return _StubAgent()
 
 
 @pytest.fixture
-async def async_client_with_mock(
-    mock_agent_service: MagicMock,
-    fake_redis: fakeredis.aioredis.FakeRedis,
-) -> AsyncGenerator[AsyncClient, None]:
-    """Create an async test client with mocked AgentService and auth."""
-    from app.main import app
-
-    app.dependency_overrides[get_agent_service] = lambda: mock_agent_service
-    app.dependency_overrides[get_async_session] = override_get_async_session
-    headers = make_auth_headers(fake_redis)
-    transport = ASGITransport(app=app)
-    async with AsyncClient(
-        transport=transport, base_url="http://test", headers=headers
-    ) as ac:
-        yield ac
-    app.dependency_overrides.clear()
+def async_client(shared_client: AsyncClient) -> Generator[AsyncClient, None, None]:
+    """Shared test client with auth."""
+    yield from use_client(shared_client, make_auth_headers())
 
 
 @pytest.fixture
-async def async_client(
-    fake_redis: fakeredis.aioredis.FakeRedis,
-) -> AsyncGenerator[AsyncClient, None]:
-    """Create an async test client with auth."""
-    from app.main import app
-
-    app.dependency_overrides[get_async_session] = override_get_async_session
-    headers = make_auth_headers(fake_redis)
-    transport = ASGITransport(app=app)
-    async with AsyncClient(
-        transport=transport, base_url="http://test", headers=headers
-    ) as ac:
-        yield ac
-    app.dependency_overrides.clear()
+def unauthed_client(shared_client: AsyncClient) -> Generator[AsyncClient, None, None]:
+    """Shared test client without auth (for public endpoints)."""
+    yield from use_client(shared_client)
 
 
 @pytest.fixture
-async def unauthed_client() -> AsyncGenerator[AsyncClient, None]:
-    """Create an async test client without auth (for public endpoints)."""
-    from app.main import app
-
-    app.dependency_overrides[get_async_session] = override_get_async_session
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as ac:
-        yield ac
-    app.dependency_overrides.clear()
+def async_client_with_mock(
+    app: FastAPI,
+    mock_agent_service: _StubAgent,
+    async_client: AsyncClient,
+) -> Generator[AsyncClient, None, None]:
+    """Authenticated client with AgentService stubbed for this test only."""
+    app.dependency_overrides[get_agent_service] = lambda: mock_agent_service
+    yield async_client
+    app.dependency_overrides.pop(get_agent_service, None)
 
 
 class TestChatEndpoint:
     """Tests for POST /api/v1/chat endpoint."""
 
-    @pytest.mark.asyncio
     async def test_chat_success(
         self,
         async_client_with_mock: AsyncClient,
     ) -> None:
         response = await async_client_with_mock.post(
             "/api/v1/chat",
-            json={"message": "Hello"},
+            content=_HELLO_BODY,
+            headers=_JSON_HEADERS,
         )
 
         assert response.status_code == 200
@@ -154,7 +142,6 @@ class TestChatEndpoint:
         assert "session_id" in data
         assert "created_at" in data
 
-    @pytest.mark.asyncio
     async def test_chat_with_conversation_id(
         self,
         async_client_with_mock: AsyncClient,
@@ -169,31 +156,23 @@ class TestChatEndpoint:
 
         assert response.status_code == 200
 
-    @pytest.mark.asyncio
-    async def test_chat_validation_error_empty_message(
-        self,
-        async_client: AsyncClient,
-    ) -> None:
-        response = await async_client.post(
-            "/api/v1/chat",
-            json={"message": ""},
-        )
-
-        assert response.status_code == 422
-
-    @pytest.mark.asyncio
-    async def test_chat_validation_error_message_too_long(
+    @pytest.mark.parametrize(
+        "message",
+        ["", "a" * 4001],
+        ids=["empty_message", "message_too_long"],
+    )
+    async def test_chat_validation_error(
         self,
         async_client: AsyncClient,
+        message: str,
     ) -> None:
         response = await async_client.post(
             "/api/v1/chat",
-            json={"message": "a" * 4001},
+            json={"message": message},
         )
 
         assert response.status_code == 422
 
-    @pytest.mark.asyncio
     async def test_chat_with_web_search_disabled(
         self,
         async_client_with_mock: AsyncClient,
@@ -212,33 +191,31 @@ class TestChatEndpoint:
 class TestStreamChatEndpoint:
     """Tests for POST /api/v1/chat/stream endpoint."""
 
-    @pytest.mark.asyncio
     async def test_stream_chat_returns_sse(
         self,
         async_client_with_mock: AsyncClient,
     ) -> None:
         response = await async_client_with_mock.post(
             "/api/v1/chat/stream",
-            json={"message": "Hello"},
+            content=_HELLO_BODY,
+            headers=_JSON_HEADERS,
         )
 
         assert response.status_code == 200
         assert "text/event-stream" in response.headers["content-type"]
 
-    @pytest.mark.asyncio
     async def test_stream_chat_event_format(
         self,
         async_client_with_mock: AsyncClient,
     ) -> None:
         response = await async_client_with_mock.post(
             "/api/v1/chat/stream",
-            json={"message": "Hello"},
+            content=_HELLO_BODY,
+            headers=_JSON_HEADERS,
         )
 
-        content = response.text
-        assert "data:" in content
+        assert response.text == _EXPECTED_STREAM_SSE
 
-    @pytest.mark.asyncio
     async def test_stream_chat_validation_error(
         self,
         async_client: AsyncClient,
@@ -254,7 +231,6 @@ class TestStreamChatEndpoint:
 class TestRegenerateEndpoint:
     """Tests for POST /api/v1/chat/regenerate endpoint."""
 
-    @pytest.mark.asyncio
     async def test_regenerate_returns_sse(
         self,
         async_client_with_mock: AsyncClient,
@@ -268,7 +244,6 @@ class TestRegenerateEndpoint:
         assert "text/event-stream" in response.headers["content-type"]
         assert "data:" in response.text
 
-    @pytest.mark.asyncio
     async def test_regenerate_validation_error_missing_fields(
         self,
         async_client: AsyncClient,
@@ -280,7 +255,6 @@ class TestRegenerateEndpoint:
 
         assert response.status_code == 422
 
-    @pytest.mark.asyncio
     async def test_regenerate_unauthenticated(
         self,
         unauthed_client: AsyncClient,
@@ -296,7 +270,6 @@ class TestRegenerateEndpoint:
 class TestEditEndpoint:
     """Tests for POST /api/v1/chat/edit endpoint."""
 
-    @pytest.mark.asyncio
     async def test_edit_returns_sse(
         self,
         async_client_with_mock: AsyncClient,
@@ -314,7 +287,6 @@ class TestEditEndpoint:
         assert "text/event-stream" in response.headers["content-type"]
         assert "data:" in response.text
 
-    @pytest.mark.asyncio
     async def test_edit_validation_error_empty_message(
         self,
         async_client: AsyncClient,
@@ -330,7 +302,6 @@ class TestEditEndpoint:
 
         assert response.status_code == 422
 
-    @pytest.mark.asyncio
     async def test_edit_validation_error_missing_fields(
         self,
         async_client: AsyncClient,
@@ -342,7 +313,6 @@ class TestEditEndpoint:
 
         assert response.status_code == 422
 
-    @pytest.mark.asyncio
     async def test_edit_unauthenticated(
         self,
         unauthed_client: AsyncClient,
@@ -362,7 +332,6 @@ class TestEditEndpoint:
 class TestChatRouterIntegration:
     """Integration tests for chat router registration."""
 
-    @pytest.mark.asyncio
     async def test_router_is_registered(
         self,
         unauthed_client: AsyncClient,
@@ -370,15 +339,13 @@ class TestChatRouterIntegration:
         response = await unauthed_client.get("/openapi.json")
         assert response.status_code == 200
 
-        openapi = response.json()
-        paths = openapi.get("paths", {})
-
-        assert "/api/v1/chat" in paths
-        assert "/api/v1/chat/stream" in paths
-        assert "/api/v1/chat/regenerate" in paths
-        assert "/api/v1/chat/edit" in paths
+        # Quoted-key substring checks avoid decoding the whole schema.
+        body = response.content
+        assert b'"/api/v1/chat"' in body
+        assert b'"/api/v1/chat/stream"' in body
+        assert b'"/api/v1/chat/regenerate"' in body
+        assert b'"/api/v1/chat/edit"' in body
 
-    @pytest.mark.asyncio
     async def test_health_check_still_works(
         self,
         unauthed_client: AsyncClient,
@@ -1,78 +1,42 @@
 """Integration tests for conversation router endpoints."""
 
 from datetime import UTC, datetime
+from typing import Any
 
+import orjson
 import pytest
-from httpx import AsyncClient
+from httpx import AsyncClient, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.chat_message import ChatMessage
 from app.models.chat_session import ChatSession
 from app.models.user import User
-from tests.conftest import make_auth_headers, test_session_factory
-
-
-async def _seed_user(email: str = "conv@test.com") -> int:
-    """Insert a user and return its id."""
-    async with test_session_factory() as session:
-        user = User(email=email, hashed_password="hashed", username=email.split("@")[0])
-        session.add(user)
-        await session.flush()
-        await session.refresh(user)
-        user_id = user.id
-        await session.commit()
-    return user_id
-
-
-async def _seed_session(
-    user_id: int,
-    conversation_id: str,
-    updated_at: datetime,
-    title: str | None = None,
-) -> int:
-    """Insert a chat session with explicit updated_at."""
-    async with test_session_factory() as session:
-        cs = ChatSession(
-            user_id=user_id,
-            conversation_id=conversation_id,
-            title=title,
-            updated_at=updated_at,
-        )
-        session.add(cs)
-        await session.flush()
-        await session.refresh(cs)
-        session_id = cs.id
-        await session.commit()
-    return session_id
-
-
-async def _seed_message(
-    session_id: int,
-    role: str,
-    content: str,
-    tool_call_id: str | None = None,
-    tool_name: str | None = None,
-) -> int:
-    """Insert a chat message and return its id."""
-    async with test_session_factory() as session:
-        msg = ChatMessage(
-            session_id=session_id,
-            role=role,
-            content=content,
-            tool_call_id=tool_call_id,
-            tool_name=tool_name,
-        )
-        session.add(msg)
-        await session.flush()
-        await session.refresh(msg)
-        msg_id = msg.id
-        await session.commit()
-    return msg_id
+from tests.conftest import make_auth_headers
+
+
+def _json_field(resp: Response, key: str) -> Any:
+    """Decode the response body with orjson and return its ``key`` field."""
+    return orjson.loads(resp.content)[key]
+
+
+async def _seed(
+    session: AsyncSession, *objects: User | ChatSession | ChatMessage
+) -> list[int]:
+    """Insert ``objects`` with one flush and one commit; return their ids.
+
+    Same-class objects in one flush go out as a single multi-row INSERT
+    (insertmanyvalues), so seeding many rows stays one round-trip per table.
+    """
+    session.add_all(objects)
+    await session.flush()
+    ids = [obj.id for obj in objects]
+    await session.commit()
+    return ids
 
 
 class TestUnauthenticated:
     """Unauthenticated requests should be rejected."""
 
-    @pytest.mark.asyncio
     async def test_returns_401_without_token(self, async_client: AsyncClient) -> None:
         resp = await async_client.get("/api/v1/conversations")
         assert resp.status_code == 401
@@ -81,117 +45,157 @@ class TestUnauthenticated:
 class TestEmptyList:
     """Empty conversation list."""
 
-    @pytest.mark.asyncio
     async def test_returns_empty(self, authed_client: AsyncClient) -> None:
         resp = await authed_client.get("/api/v1/conversations")
         assert resp.status_code == 200
-        body = resp.json()
-        assert body["data"]["conversations"] == []
-        assert body["data"]["has_next"] is False
-        assert body["data"]["next_cursor"] is None
+        body = _json_field(resp, "data")
+        assert body["conversations"] == []
+        assert body["has_next"] is False
+        assert body["next_cursor"] is None
 
 
 class TestListConversations:
     """Conversation list with data."""
 
-    @pytest.mark.asyncio
     async def test_only_own_sessions(
-        self, fake_redis: object, async_client: AsyncClient
+        self,
+        db_session: AsyncSession,
+        async_client: AsyncClient,
     ) -> None:
-        user_a = await _seed_user("a@test.com")
-        user_b = await _seed_user("b@test.com")
+        user_a, user_b = await _seed(
+            db_session,
+            User(email="a@test.com", hashed_password="hashed", username="a"),
+            User(email="b@test.com", hashed_password="hashed", username="b"),
+        )
         ts = datetime(2026, 1, 1, tzinfo=UTC)
 
-        await _seed_session(user_a, "conv-a", ts)
-        await _seed_session(user_b, "conv-b", ts)
+        await _seed(
+            db_session,
+            ChatSession(user_id=user_a, conversation_id="conv-a", updated_at=ts),
+            ChatSession(user_id=user_b, conversation_id="conv-b", updated_at=ts),
+        )
 
-        headers = make_auth_headers(fake_redis, user_id=user_a, email="a@test.com")
+        headers = make_auth_headers(user_id=user_a, email="a@test.com")
         resp = await async_client.get("/api/v1/conversations", headers=headers)
         assert resp.status_code == 200
-        convs = resp.json()["data"]["conversations"]
+        convs = _json_field(resp, "data")["conversations"]
         assert len(convs) == 1
         assert convs[0]["conversation_id"] == "conv-a"
 
-    @pytest.mark.asyncio
     async def test_sorted_by_updated_at_desc(
-        self, fake_redis: object, async_client: AsyncClient
+        self,
+        db_session: AsyncSession,
+        async_client: AsyncClient,
     ) -> None:
-        user_id = await _seed_user("sort@test.com")
-        await _seed_session(user_id, "old", datetime(2026, 1, 1, tzinfo=UTC))
-        await _seed_session(user_id, "mid", datetime(2026, 1, 2, tzinfo=UTC))
-        await _seed_session(user_id, "new", datetime(2026, 1, 3, tzinfo=UTC))
+        (user_id,) = await _seed(
+            db_session,
+            User(email="sort@test.com", hashed_password="hashed", username="sort"),
+        )
+        await _seed(
+            db_session,
+            *(
+                ChatSession(
+                    user_id=user_id,
+                    conversation_id=conversation_id,
+                    updated_at=datetime(2026, 1, day, tzinfo=UTC),
+                )
+                for day, conversation_id in enumerate(["old", "mid", "new"], start=1)
+            ),
+        )
 
-        headers = make_auth_headers(fake_redis, user_id=user_id, email="sort@test.com")
+        headers = make_auth_headers(user_id=user_id, email="sort@test.com")
         resp = await async_client.get("/api/v1/conversations", headers=headers)
-        ids = [c["conversation_id"] for c in resp.json()["data"]["conversations"]]
+        ids = [c["conversation_id"] for c in _json_field(resp, "data")["conversations"]]
         assert ids == ["new", "mid", "old"]
 
-    @pytest.mark.asyncio
     async def test_pagination_flow(
-        self, fake_redis: object, async_client: AsyncClient
+        self,
+        db_session: AsyncSession,
+        async_client: AsyncClient,
     ) -> None:
-        user_id = await _seed_user("page@test.com")
-        for i in range(5):
-            ts = datetime(2026, 1, i + 1, tzinfo=UTC)
-            await _seed_session(user_id, f"p-{i}", ts)
-
-        headers = make_auth_headers(fake_redis, user_id=user_id, email="page@test.com")
-
-        # Page 1: limit=2
-        resp = await async_client.get("/api/v1/conversations?limit=2", headers=headers)
-        body = resp.json()["data"]
-        assert len(body["conversations"]) == 2
-        assert body["has_next"] is True
-        cursor = body["next_cursor"]
-
-        # Page 2
-        resp = await async_client.get(
-            f"/api/v1/conversations?limit=2&cursor={cursor}", headers=headers
+        (user_id,) = await _seed(
+            db_session,
+            User(email="page@test.com", hashed_password="hashed", username="page"),
         )
-        body = resp.json()["data"]
-        assert len(body["conversations"]) == 2
-        assert body["has_next"] is True
-        cursor = body["next_cursor"]
-
-        # Page 3 (last)
-        resp = await async_client.get(
-            f"/api/v1/conversations?limit=2&cursor={cursor}", headers=headers
+        await _seed(
+            db_session,
+            *(
+                ChatSession(
+                    user_id=user_id,
+                    conversation_id=f"p-{i}",
+                    updated_at=datetime(2026, 1, i + 1, tzinfo=UTC),
+                )
+                for i in range(5)
+            ),
         )
-        body = resp.json()["data"]
-        assert len(body["conversations"]) == 1
-        assert body["has_next"] is False
-        assert body["next_cursor"] is None
 
-    @pytest.mark.asyncio
+        headers = make_auth_headers(user_id=user_id, email="page@test.com")
+
+        # limit=2 over 5 sessions -> pages of 2, 2, 1
+        cursor: str | None = None
+        for expected_len, expected_next in [(2, True), (2, True), (1, False)]:
+            url = "/api/v1/conversations?limit=2"
+            if cursor is not None:
+                url += f"&cursor={cursor}"
+            resp = await async_client.get(url, headers=headers)
+            body = _json_field(resp, "data")
+            assert len(body["conversations"]) == expected_len
+            assert body["has_next"] is expected_next
+            cursor = body["next_cursor"]
+        assert cursor is None
+
     async def test_default_limit(
-        self, fake_redis: object, async_client: AsyncClient
+        self,
+        db_session: AsyncSession,
+        async_client: AsyncClient,
     ) -> None:
-        user_id = await _seed_user("deflimit@test.com")
+        (user_id,) = await _seed(
+            db_session,
+            User(
+                email="deflimit@test.com", hashed_password="hashed", username="deflimit"
+            ),
+        )
         ts = datetime(2026, 1, 1, tzinfo=UTC)
-        await _seed_session(user_id, "dl-1", ts)
-
-        headers = make_auth_headers(
-            fake_redis, user_id=user_id, email="deflimit@test.com"
+        await _seed(
+            db_session,
+            ChatSession(user_id=user_id, conversation_id="dl-1", updated_at=ts),
         )
+
+        headers = make_auth_headers(user_id=user_id, email="deflimit@test.com")
         resp = await async_client.get("/api/v1/conversations", headers=headers)
         assert resp.status_code == 200
 
-    @pytest.mark.asyncio
     async def test_preview_included(
-        self, fake_redis: object, async_client: AsyncClient
+        self,
+        db_session: AsyncSession,
+        async_client: AsyncClient,
     ) -> None:
-        user_id = await _seed_user("preview@test.com")
+        (user_id,) = await _seed(
+            db_session,
+            User(
+                email="preview@test.com", hashed_password="hashed", username="preview"
+            ),
+        )
         ts = datetime(2026, 1, 1, tzinfo=UTC)
-        session_id = await _seed_session(user_id, "conv-prev", ts, title="제목")
-        await _seed_message(session_id, "human", "첫 번째 메시지")
-        await _seed_message(session_id, "ai", "AI 응답")
-        await _seed_message(session_id, "human", "마지막 메시지")
-
-        headers = make_auth_headers(
-            fake_redis, user_id=user_id, email="preview@test.com"
+        (session_id,) = await _seed(
+            db_session,
+            ChatSession(
+                user_id=user_id,
+                conversation_id="conv-prev",
+                title="제목",
+                updated_at=ts,
+            ),
+        )
+        await _seed(
+            db_session,
+            ChatMessage(session_id=session_id, role="human", content="첫 번째 메시지"),
+            ChatMessage(session_id=session_id, role="ai", content="AI 응답"),
+            ChatMessage(session_id=session_id, role="human", content="마지막 메시지"),
         )
+
+        headers = make_auth_headers(user_id=user_id, email="preview@test.com")
         resp = await async_client.get("/api/v1/conversations", headers=headers)
-        conv = resp.json()["data"]["conversations"][0]
+        conv = _json_field(resp, "data")["conversations"][0]
         assert conv["title"] == "제목"
         assert conv["last_message_preview"] == "마지막 메시지"
 
@@ -199,116 +203,168 @@ class TestListConversations:
 class TestGetConversationMessages:
     """Tests for GET /api/v1/conversations/{conversation_id}/messages."""
 
-    @pytest.mark.asyncio
     async def test_get_messages_success(
-        self, fake_redis: object, async_client: AsyncClient
+        self,
+        db_session: AsyncSession,
+        async_client: AsyncClient,
     ) -> None:
-        user_id = await _seed_user("msg@test.com")
+        (user_id,) = await _seed(
+            db_session,
+            User(email="msg@test.com", hashed_password="hashed", username="msg"),
+        )
         ts = datetime(2026, 1, 1, tzinfo=UTC)
-        session_id = await _seed_session(user_id, "conv-msg", ts)
-        await _seed_message(session_id, "human", "질문입니다")
-        await _seed_message(
-            session_id,
-            "tool",
-            "검색 결과",
-            tool_call_id="call_1",
-            tool_name="web_search",
-        )
-        await _seed_message(session_id, "ai", "AI 응답입니다")
-
-        headers = make_auth_headers(fake_redis, user_id=user_id, email="msg@test.com")
+        (session_id,) = await _seed(
+            db_session,
+            ChatSession(user_id=user_id, conversation_id="conv-msg", updated_at=ts),
+        )
+        await _seed(
+            db_session,
+            ChatMessage(session_id=session_id, role="human", content="질문입니다"),
+            ChatMessage(
+                session_id=session_id,
+                role="tool",
+                content="검색 결과",
+                tool_call_id="call_1",
+                tool_name="web_search",
+            ),
+            ChatMessage(session_id=session_id, role="ai", content="AI 응답입니다"),
+        )
+
+        headers = make_auth_headers(user_id=user_id, email="msg@test.com")
         resp = await async_client.get(
             "/api/v1/conversations/conv-msg/messages", headers=headers
         )
         assert resp.status_code == 200
-        body = resp.json()["data"]
+        body = _json_field(resp, "data")
         assert body["conversation_id"] == "conv-msg"
         assert len(body["messages"]) == 3
         assert body["messages"][0]["role"] == "human"
         assert body["messages"][1]["role"] == "tool"
         assert body["messages"][2]["role"] == "ai"
 
-    @pytest.mark.asyncio
     async def test_get_messages_empty_conversation(
-        self, fake_redis: object, async_client: AsyncClient
+        self,
+        db_session: AsyncSession,
+        async_client: AsyncClient,
     ) -> None:
-        user_id = await _seed_user("empty-msg@test.com")
+        (user_id,) = await _seed(
+            db_session,
+            User(
+                email="empty-msg@test.com",
+                hashed_password="hashed",
+                username="empty-msg",
+            ),
+        )
         ts = datetime(2026, 1, 1, tzinfo=UTC)
-        await _seed_session(user_id, "conv-empty-msg", ts)
-
-        headers = make_auth_headers(
-            fake_redis, user_id=user_id, email="empty-msg@test.com"
+        await _seed(
+            db_session,
+            ChatSession(
+                user_id=user_id, conversation_id="conv-empty-msg", updated_at=ts
+            ),
         )
+
+        headers = make_auth_headers(user_id=user_id, email="empty-msg@test.com")
         resp = await async_client.get(
             "/api/v1/conversations/conv-empty-msg/messages", headers=headers
         )
         assert resp.status_code == 200
-        body = resp.json()["data"]
+        body = _json_field(resp, "data")
         assert body["conversation_id"] == "conv-empty-msg"
         assert body["messages"] == []
 
-    @pytest.mark.asyncio
     async def test_get_messages_not_found(
-        self, fake_redis: object, async_client: AsyncClient
+        self,
+        db_session: AsyncSession,
+        async_client: AsyncClient,
     ) -> None:
-        user_id = await _seed_user("nf-msg@test.com")
-        headers = make_auth_headers(
-            fake_redis, user_id=user_id, email="nf-msg@test.com"
+        (user_id,) = await _seed(
+            db_session,
+            User(email="nf-msg@test.com", hashed_password="hashed", username="nf-msg"),
         )
+        headers = make_auth_headers(user_id=user_id, email="nf-msg@test.com")
         resp = await async_client.get(
             "/api/v1/conversations/non-existent/messages", headers=headers
         )
         assert resp.status_code == 404
-        assert resp.json()["code"] == "SESSION_NOT_FOUND"
+        assert _json_field(resp, "code") == "SESSION_NOT_FOUND"
 
-    @pytest.mark.asyncio
     async def test_get_messages_not_authorized(
-        self, fake_redis: object, async_client: AsyncClient
+        self,
+        db_session: AsyncSession,
+        async_client: AsyncClient,
     ) -> None:
-        owner_id = await _seed_user("msg-owner@test.com")
-        other_id = await _seed_user("msg-other@test.com")
+        owner_id, other_id = await _seed(
+            db_session,
+            User(
+                email="msg-owner@test.com",
+                hashed_password="hashed",
+                username="msg-owner",
+            ),
+            User(
+                email="msg-other@test.com",
+                hashed_password="hashed",
+                username="msg-other",
+            ),
+        )
         ts = datetime(2026, 1, 1, tzinfo=UTC)
-        session_id = await _seed_session(owner_id, "conv-msg-auth", ts)
-        await _seed_message(session_id, "human", "비밀 메시지")
-
-        headers = make_auth_headers(
-            fake_redis, user_id=other_id, email="msg-other@test.com"
+        (session_id,) = await _seed(
+            db_session,
+            ChatSession(
+                user_id=owner_id, conversation_id="conv-msg-auth", updated_at=ts
+            ),
         )
+        await _seed(
+            db_session,
+            ChatMessage(session_id=session_id, role="human", content="비밀 메시지"),
+        )
+
+        headers = make_auth_headers(user_id=other_id, email="msg-other@test.com")
         resp = await async_client.get(
             "/api/v1/conversations/conv-msg-auth/messages", headers=headers
         )
         assert resp.status_code == 403
 
-    @pytest.mark.asyncio
     async def test_get_messages_unauthenticated(
         self, async_client: AsyncClient
     ) -> None:
         resp = await async_client.get("/api/v1/conversations/any-conv/messages")
         assert resp.status_code == 401
 
-    @pytest.mark.asyncio
     async def test_get_messages_with_tool_fields(
-        self, fake_redis: object, async_client: AsyncClient
+        self,
+        db_session: AsyncSession,
+        async_client: AsyncClient,
     ) -> None:
-        user_id = await _seed_user("tool-msg@test.com")
+        (user_id,) = await _seed(
+            db_session,
+            User(
+                email="tool-msg@test.com", hashed_password="hashed", username="tool-msg"
+            ),
+        )
         ts = datetime(2026, 1, 1, tzinfo=UTC)
-        session_id = await _seed_session(user_id, "conv-tool-msg", ts)
-        await _seed_message(
-            session_id,
-            "tool",
-            "검색 결과 내용",
-            tool_call_id="call_abc",
-            tool_name="web_search",
+        (session_id,) = await _seed(
+            db_session,
+            ChatSession(
+                user_id=user_id, conversation_id="conv-tool-msg", updated_at=ts
+            ),
         )
-
-        headers = make_auth_headers(
-            fake_redis, user_id=user_id, email="tool-msg@test.com"
+        await _seed(
+            db_session,
+            ChatMessage(
+                session_id=session_id,
+                role="tool",
+                content="검색 결과 내용",
+                tool_call_id="call_abc",
+                tool_name="web_search",
+            ),
         )
+
+        headers = make_auth_headers(user_id=user_id, email="tool-msg@test.com")
         resp = await async_client.get(
             "/api/v1/conversations/conv-tool-msg/messages", headers=headers
         )
         assert resp.status_code == 200
-        msg = resp.json()["data"]["messages"][0]
+        msg = _json_field(resp, "data")["messages"][0]
         assert msg["tool_call_id"] == "call_abc"
         assert msg["tool_name"] == "web_search"
 
@@ -316,49 +372,72 @@ class TestGetConversationMessages:
 class TestUpdateTitle:
     """Tests for PATCH /api/v1/conversations/{conversation_id}/title."""
 
-    @pytest.mark.asyncio
     async def test_update_title_success(
-        self, fake_redis: object, async_client: AsyncClient
+        self,
+        db_session: AsyncSession,
+        async_client: AsyncClient,
     ) -> None:
-        user_id = await _seed_user("title@test.com")
+        (user_id,) = await _seed(
+            db_session,
+            User(email="title@test.com", hashed_password="hashed", username="title"),
+        )
         ts = datetime(2026, 1, 1, tzinfo=UTC)
-        await _seed_session(user_id, "conv-title-up", ts, title="기존 제목")
+        await _seed(
+            db_session,
+            ChatSession(
+                user_id=user_id,
+                conversation_id="conv-title-up",
+                title="기존 제목",
+                updated_at=ts,
+            ),
+        )
 
-        headers = make_auth_headers(fake_redis, user_id=user_id, email="title@test.com")
+        headers = make_auth_headers(user_id=user_id, email="title@test.com")
         resp = await async_client.patch(
             "/api/v1/conversations/conv-title-up/title",
             json={"title": "새 제목"},
             headers=headers,
         )
         assert resp.status_code == 200
-        assert resp.json()["message"] == "Title updated"
+        assert _json_field(resp, "message") == "Title updated"
 
-    @pytest.mark.asyncio
     async def test_update_title_not_found(
-        self, fake_redis: object, async_client: AsyncClient
+        self,
+        db_session: AsyncSession,
+        async_client: AsyncClient,
     ) -> None:
-        user_id = await _seed_user("nf@test.com")
-        headers = make_auth_headers(fake_redis, user_id=user_id, email="nf@test.com")
+        (user_id,) = await _seed(
+            db_session,
+            User(email="nf@test.com", hashed_password="hashed", username="nf"),
+        )
+        headers = make_auth_headers(user_id=user_id, email="nf@test.com")
         resp = await async_client.patch(
             "/api/v1/conversations/non-existent/title",
             json={"title": "새 제목"},
             headers=headers,
         )
         assert resp.status_code == 404
-        assert resp.json()["code"] == "SESSION_NOT_FOUND"
+        assert _json_field(resp, "code") == "SESSION_NOT_FOUND"
 
-    @pytest.mark.asyncio
     async def test_update_title_not_authorized(
-        self, fake_redis: object, async_client: AsyncClient
+        self,
+        db_session: AsyncSession,
+        async_client: AsyncClient,
     ) -> None:
-        owner_id = await _seed_user("owner@test.com")
-        other_id = await _seed_user("other@test.com")
+        owner_id, other_id = await _seed(
+            db_session,
+            User(email="owner@test.com", hashed_password="hashed", username="owner"),
+            User(email="other@test.com", hashed_password="hashed", username="other"),
+        )
         ts = datetime(2026, 1, 1, tzinfo=UTC)
-        await _seed_session(owner_id, "conv-auth-test", ts)
-
-        headers = make_auth_headers(
-            fake_redis, user_id=other_id, email="other@test.com"
+        await _seed(
+            db_session,
+            ChatSession(
+                user_id=owner_id, conversation_id="conv-auth-test", updated_at=ts
+            ),
         )
+
+        headers = make_auth_headers(user_id=other_id, email="other@test.com")
         resp = await async_client.patch(
             "/api/v1/conversations/conv-auth-test/title",
             json={"title": "새 제목"},
@@ -366,7 +445,6 @@ class TestUpdateTitle:
         )
         assert resp.status_code == 403
 
-    @pytest.mark.asyncio
     async def test_update_title_validation_too_long(
         self, authed_client: AsyncClient
     ) -> None:
@@ -376,7 +454,6 @@ class TestUpdateTitle:
         )
         assert resp.status_code == 422
 
-    @pytest.mark.asyncio
     async def test_update_title_validation_empty(
         self, authed_client: AsyncClient
     ) -> None:
@@ -386,7 +463,6 @@ class TestUpdateTitle:
         )
         assert resp.status_code == 422
 
-    @pytest.mark.asyncio
     async def test_update_title_unauthenticated(
         self, async_client: AsyncClient
     ) -> None:
@@ -400,22 +476,19 @@ class TestUpdateTitle:
 class TestValidation:
     """Input validation."""
 
-    @pytest.mark.asyncio
-    async def test_invalid_cursor_returns_400(self, authed_client: AsyncClient) -> None:
-        resp = await authed_client.get("/api/v1/conversations?cursor=not-valid!!!")
-        assert resp.status_code == 400
-        assert resp.json()["code"] == "INVALID_CURSOR"
-
-    @pytest.mark.asyncio
-    async def test_limit_below_min_returns_422(
-        self, authed_client: AsyncClient
-    ) -> None:
-        resp = await authed_client.get("/api/v1/conversations?limit=0")
-        assert resp.status_code == 422
-
-    @pytest.mark.asyncio
-    async def test_limit_above_max_returns_422(
-        self, authed_client: AsyncClient
+    @pytest.mark.parametrize(
+        ("query", "status", "code"),
+        [
+            ("cursor=not-valid!!!", 400, "INVALID_CURSOR"),
+            ("limit=0", 422, None),
+            ("limit=101", 422, None),
+        ],
+        ids=["invalid_cursor", "limit_below_min", "limit_above_max"],
+    )
+    async def test_rejects_invalid_query(
+        self, authed_client: AsyncClient, query: str, status: int, code: str | None
     ) -> None:
-        resp = await authed_client.get("/api/v1/conversations?limit=101")
-        assert resp.status_code == 422
+        resp = await authed_client.get(f"/api/v1/conversations?{query}")
+        assert resp.status_code == status
+        if code is not None:
+            assert _json_field(resp, "code") == code
@@ -2,13 +2,19 @@
 
 import json
 import re
-from datetime import datetime
+from collections.abc import Generator
+from dataclasses import dataclass
+from datetime import datetime, tzinfo
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 from zoneinfo import ZoneInfo
 
+import orjson
 import pytest
 from langchain_core.messages import (
     AIMessage,
+    BaseMessage,
     HumanMessage,
     SystemMessage,
     ToolMessage,
@@ -22,58 +28,172 @@ from app.core.exceptions import (
 )
 from app.models.chat_message import ChatMessage
 from app.repositories.chat_repo import ChatRepository
-from app.schemas.chat_schema import ChatRequest, ChatResponse, StreamEvent
-from app.services.agent_service import AgentService
+from app.schemas.chat_schema import ChatRequest, ChatResponse
+from app.services.agent_service import TOOL_RESULT_MAX_CHARS, AgentService
+
+# Shared message fixtures for the mocked agent; LangChain messages are
+# Pydantic models, so build them once instead of in every test.
+_HELLO_HUMAN = HumanMessage(content="Hello")
+_HELLO_AI = AIMessage(content="Hello")
+_HI_AI = AIMessage(content="Hi!")
+_HI_AI_CHUNK = AIMessage(content="Hi")
+_HI_STREAM = ({"event": "on_chat_model_stream", "data": {"chunk": _HI_AI_CHUNK}},)
+_SEARCH_HUMAN = HumanMessage(content="Search")
+_NEW_QUESTION_HUMAN = HumanMessage(content="New question")
+_REGENERATED_AI = AIMessage(content="Regenerated!")
+_EDITED_AI = AIMessage(content="Edited response!")
+_SEARCH_TOOL_CALL = AIMessage(
+    content="",
+    tool_calls=[{"name": "web_search", "args": {"query": "test"}, "id": "c1"}],
+)
 
+# Stored rows fed to the service helpers; none of them mutate their input.
+_ORDERED_DB_MESSAGES = (
+    ChatMessage(id=1, session_id=1, role="human", content="Q1"),
+    ChatMessage(id=2, session_id=1, role="ai", content="A1"),
+    ChatMessage(id=3, session_id=1, role="human", content="Q2"),
+)
+_HELLO_DB_MESSAGE = ChatMessage(id=1, session_id=1, role="human", content="Hello")
+_QUESTION_RECORD = ChatMessage(id=10, session_id=1, role="human", content="Q")
+_ANSWER_RECORD = ChatMessage(id=11, session_id=1, role="ai", content="A")
+_TOOL_RECORD = ChatMessage(id=5, session_id=1, role="tool", content="result")
+_FINAL_ANSWER_RECORD = ChatMessage(id=6, session_id=1, role="ai", content="Answer")
+_TOOL_CALL_DB_MESSAGE = ChatMessage(
+    id=3,
+    session_id=1,
+    role="ai",
+    content="",
+    tool_calls_json=json.dumps(
+        [{"name": "web_search", "args": {"query": "test"}, "id": "call_1"}]
+    ),
+)
 
-@pytest.fixture
+
+@dataclass(slots=True)
+class _FakeSession:
+    """Session stand-in exposing only the fields the service reads."""
+
+    id: int = 1
+    user_id: int = 1
+
+
+@dataclass(slots=True)
+class _FakeMessage:
+    """Message stand-in exposing only the fields the service reads."""
+
+    session_id: int = 1
+    role: str = "ai"
+
+
+class _StreamEvents:
+    """Stand-in for ``astream_events`` that replays ``events`` on each call.
+
+    A plain async iterator avoids building a new generator function and frame
+    per test; iteration restarts every time the agent is called.
+    """
+
+    def __init__(self, *events: dict[str, Any]) -> None:
+        self._events = events
+        self._index = 0
+
+    def __call__(self, *args: Any, **kwargs: Any) -> "_StreamEvents":
+        return self
+
+    def __aiter__(self) -> "_StreamEvents":
+        self._index = 0
+        return self
+
+    async def __anext__(self) -> dict[str, Any]:
+        if self._index >= len(self._events):
+            raise StopAsyncIteration
+        event = self._events[self._index]
+        self._index += 1
+        return event
+
+
+@pytest.fixture(scope="module")
 def mock_llm() -> MagicMock:
-    """Create a mock LLM."""
+    """Create a mock LLM shared by the module (call history reset per test)."""
     mock = MagicMock()
     mock.bind_tools = MagicMock(return_value=mock)
     return mock
 
 
+@pytest.fixture(autouse=True)
+def _reset_mock_llm(mock_llm: MagicMock) -> Generator[None, None, None]:
+    yield
+    mock_llm.reset_mock()
+
+
 @pytest.fixture
 def mock_chat_repo() -> MagicMock:
     """Create a mock ChatRepository."""
     mock = MagicMock(spec=ChatRepository)
     mock.find_session_by_conversation_id = AsyncMock(return_value=None)
-
-    session_mock = MagicMock()
-    session_mock.id = 1
-    mock.create_session = AsyncMock(return_value=session_mock)
+    mock.find_session_with_messages = AsyncMock(return_value=(None, []))
+    mock.create_session = AsyncMock(return_value=_FakeSession())
     mock.find_messages_by_session_id = AsyncMock(return_value=[])
+    mock.find_message_by_id = AsyncMock(return_value=None)
+    mock.delete_messages_from_id = AsyncMock()
     mock.create_messages_bulk = AsyncMock()
+    mock.insert_messages_bulk = AsyncMock()
     return mock
 
 
 @pytest.fixture
-def agent_service(mock_llm: MagicMock, mock_chat_repo: MagicMock) -> AgentService:
-    """Create an AgentService instance with mock dependencies."""
+def patched_agent(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Make create_react_agent return one mock agent for the test to configure.
+
+    By default the agent answers "Hello" with "Hi!" from ``ainvoke`` and
+    streams a single "Hi" chunk; tests override only what they assert on.
+    """
+    final_state = SimpleNamespace(values={"messages": [_HELLO_HUMAN, _HI_AI_CHUNK]})
+    agent = SimpleNamespace(
+        ainvoke=AsyncMock(return_value={"messages": [_HELLO_HUMAN, _HI_AI]}),
+        astream_events=_StreamEvents(*_HI_STREAM),
+        aget_state=AsyncMock(return_value=final_state),
+    )
+    monkeypatch.setattr(
+        "app.services.agent_service.create_react_agent", lambda *a, **kw: agent
+    )
+    return agent
+
+
+@pytest.fixture(scope="module")
+def agent_service(mock_llm: MagicMock) -> AgentService:
+    """Create one AgentService for the tests that only inspect it."""
+    return AgentService(
+        llm=mock_llm, chat_repo=MagicMock(spec=ChatRepository), user_id=1
+    )
+
+
+@pytest.fixture
+def service(
+    mock_llm: MagicMock,
+    mock_chat_repo: MagicMock,
+    patched_agent: SimpleNamespace,
+) -> AgentService:
+    """Build an AgentService over this test's mock agent and repository.
+
+    Depends on ``patched_agent`` so create_react_agent is patched before the
+    service compiles its agent.
+    """
     return AgentService(llm=mock_llm, chat_repo=mock_chat_repo, user_id=1)
 
 
 class TestAgentServiceInit:
     """Tests for AgentService initialization."""
 
-    def test_agent_service_creates_with_dependencies(
+    def test_agent_service_is_fully_initialized(
         self, mock_llm: MagicMock, mock_chat_repo: MagicMock
     ) -> None:
         service = AgentService(llm=mock_llm, chat_repo=mock_chat_repo, user_id=42)
         assert service._llm is mock_llm
         assert service._chat_repo is mock_chat_repo
         assert service._user_id == 42
-
-    def test_agent_service_has_memory(self, agent_service: AgentService) -> None:
-        assert agent_service._memory is not None
-
-    def test_agent_service_has_tools(self, agent_service: AgentService) -> None:
-        assert agent_service._tools is not None
-        assert len(agent_service._tools) > 0
-
-    def test_agent_service_has_agent(self, agent_service: AgentService) -> None:
-        assert agent_service._agent is not None
+        assert service._memory is not None
+        assert service._tools
+        assert service._agent is not None
 
     def test_agent_created_with_system_prompt(
         self, mock_llm: MagicMock, mock_chat_repo: MagicMock
@@ -81,45 +201,58 @@ class TestAgentServiceInit:
         with patch(
             "app.services.agent_service.create_react_agent"
         ) as mock_create_agent:
-            mock_create_agent.return_value = MagicMock()
-            AgentService(llm=mock_llm, chat_repo=mock_chat_repo, user_id=1)
+            service = AgentService(llm=mock_llm, chat_repo=mock_chat_repo, user_id=1)
+
+        _, kwargs = mock_create_agent.call_args
+        assert kwargs["prompt"] == service._build_system_prompt
+
+
+_KST = ZoneInfo("Asia/Seoul")
+_FROZEN_NOW = datetime(2026, 1, 1, 12, 0, 0, tzinfo=_KST)
+_KST_TIMESTAMP = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} KST")
+
+
+class _FrozenDatetime(datetime):
+    """``datetime`` whose ``now()`` always returns ``_FROZEN_NOW``."""
+
+    @classmethod
+    def now(cls, tz: tzinfo | None = None) -> datetime:  # type: ignore[override]
+        return _FROZEN_NOW.astimezone(tz) if tz else _FROZEN_NOW
+
 
-            _, kwargs = mock_create_agent.call_args
-            assert "prompt" in kwargs
-            assert callable(kwargs["prompt"])
+@pytest.fixture(scope="class")
+def frozen_now() -> Generator[None, None, None]:
+    """Pin the agent service clock to ``_FROZEN_NOW`` for a test class."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("app.services.agent_service.datetime", _FrozenDatetime)
+        yield
 
 
+@pytest.fixture(scope="class")
+def prompt(frozen_now: None) -> str:
+    """System prompt content, built once per class."""
+    system_message = AgentService._build_system_prompt({"messages": []})[0]
+    return system_message.content
+
+
+@pytest.mark.usefixtures("frozen_now")
 class TestBuildSystemPrompt:
     """Tests for AgentService._build_system_prompt static method."""
 
-    def _make_state(self, messages: list[HumanMessage] | None = None) -> dict:
-        if messages is None:
-            messages = [HumanMessage(content="Hello")]
-        return {"messages": messages}
-
     def test_returns_system_message_first(self) -> None:
-        state = self._make_state()
-        result = AgentService._build_system_prompt(state)
+        result = AgentService._build_system_prompt({"messages": [_HELLO_HUMAN]})
 
         assert isinstance(result[0], SystemMessage)
 
-    def test_contains_current_date(self) -> None:
-        state = self._make_state()
-        result = AgentService._build_system_prompt(state)
-        today = datetime.now(tz=ZoneInfo("Asia/Seoul")).strftime("%Y-%m-%d")
-
-        assert today in result[0].content
-
-    def test_contains_kst_timezone(self) -> None:
-        state = self._make_state()
-        result = AgentService._build_system_prompt(state)
+    def test_contains_current_date(self, prompt: str) -> None:
+        assert "2026-01-01 12:00:00 KST" in prompt
 
-        assert "KST" in result[0].content
+    def test_contains_kst_timezone(self, prompt: str) -> None:
+        assert "KST" in prompt
 
     def test_preserves_state_messages(self) -> None:
         msgs = [HumanMessage(content="Q1"), HumanMessage(content="Q2")]
-        state = self._make_state(msgs)
-        result = AgentService._build_system_prompt(state)
+        result = AgentService._build_system_prompt({"messages": msgs})
 
         assert len(result) == 3
         assert isinstance(result[1], HumanMessage)
@@ -127,635 +260,398 @@ class TestBuildSystemPrompt:
         assert isinstance(result[2], HumanMessage)
         assert result[2].content == "Q2"
 
-    def test_contains_time_instruction(self) -> None:
-        state = self._make_state()
-        result = AgentService._build_system_prompt(state)
-        content = result[0].content
+    def test_contains_time_instruction(self, prompt: str) -> None:
+        assert "today" in prompt
+        assert "tomorrow" in prompt
+        assert "yesterday" in prompt
 
-        assert "today" in content
-        assert "tomorrow" in content
-        assert "yesterday" in content
+    def test_date_format_pattern(self, prompt: str) -> None:
+        assert _KST_TIMESTAMP.search(prompt) is not None
 
-    def test_date_format_pattern(self) -> None:
-        state = self._make_state()
-        result = AgentService._build_system_prompt(state)
-        content = result[0].content
 
-        pattern = r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} KST"
-        assert re.search(pattern, content) is not None
+_UUID_HEX = re.compile(r"[0-9a-f]{32}")
 
 
 class TestAgentServiceChat:
     """Tests for AgentService.chat method."""
 
-    @pytest.mark.asyncio
     async def test_chat_returns_response_and_is_new_flag(
-        self, mock_llm: MagicMock, mock_chat_repo: MagicMock
+        self,
+        service: AgentService,
+        mock_chat_repo: MagicMock,
+        patched_agent: SimpleNamespace,
     ) -> None:
-        with patch(
-            "app.services.agent_service.create_react_agent"
-        ) as mock_create_agent:
-            mock_agent = MagicMock()
-            mock_agent.ainvoke = AsyncMock(
-                return_value={
-                    "messages": [
-                        HumanMessage(content="Hello"),
-                        AIMessage(content="Hi there!"),
-                    ]
-                }
-            )
-            mock_create_agent.return_value = mock_agent
+        patched_agent.ainvoke = AsyncMock(
+            return_value={
+                "messages": [
+                    _HELLO_HUMAN,
+                    AIMessage(content="Hi there!"),
+                ]
+            }
+        )
 
-            service = AgentService(llm=mock_llm, chat_repo=mock_chat_repo, user_id=1)
-            request = ChatRequest(message="Hello")
+        request = ChatRequest.model_construct(message="Hello")
 
-            response, is_new = await service.chat(request)
+        response, is_new = await service.chat(request)
 
-            assert isinstance(response, ChatResponse)
-            assert response.message == "Hi there!"
-            assert response.conversation_id is not None
-            assert response.session_id == 1
-            assert is_new is True
+        assert isinstance(response, ChatResponse)
+        assert response.message == "Hi there!"
+        assert _UUID_HEX.fullmatch(response.conversation_id)
+        assert response.session_id == 1
+        assert is_new is True
 
-    @pytest.mark.asyncio
     async def test_chat_preserves_conversation_id(
-        self, mock_llm: MagicMock, mock_chat_repo: MagicMock
+        self,
+        service: AgentService,
+        mock_chat_repo: MagicMock,
     ) -> None:
-        with patch(
-            "app.services.agent_service.create_react_agent"
-        ) as mock_create_agent:
-            mock_agent = MagicMock()
-            mock_agent.ainvoke = AsyncMock(
-                return_value={
-                    "messages": [
-                        HumanMessage(content="Hello"),
-                        AIMessage(content="Hi!"),
-                    ]
-                }
-            )
-            mock_create_agent.return_value = mock_agent
-
-            service = AgentService(llm=mock_llm, chat_repo=mock_chat_repo, user_id=1)
-            request = ChatRequest(
-                message="Hello",
-                conversation_id="existing-conv-123",
-            )
+        request = ChatRequest.model_construct(
+            message="Hello",
+            conversation_id="existing-conv-123",
+        )
 
-            response, _ = await service.chat(request)
+        response, _ = await service.chat(request)
 
-            assert response.conversation_id == "existing-conv-123"
+        assert response.conversation_id == "existing-conv-123"
 
-    @pytest.mark.asyncio
     async def test_chat_extracts_sources_from_tool_results(
-        self, mock_llm: MagicMock, mock_chat_repo: MagicMock
+        self,
+        service: AgentService,
+        mock_chat_repo: MagicMock,
+        patched_agent: SimpleNamespace,
     ) -> None:
-        with patch(
-            "app.services.agent_service.create_react_agent"
-        ) as mock_create_agent:
-            mock_agent = MagicMock()
-            mock_agent.ainvoke = AsyncMock(
-                return_value={
-                    "messages": [
-                        HumanMessage(content="Search for weather"),
-                        ToolMessage(
-                            content="[link: https://weather.com/seoul]",
-                            tool_call_id="call_1",
-                        ),
-                        AIMessage(content="The weather is sunny."),
-                    ]
-                }
-            )
-            mock_create_agent.return_value = mock_agent
-
-            service = AgentService(llm=mock_llm, chat_repo=mock_chat_repo, user_id=1)
-            request = ChatRequest(message="Search for weather")
-
-            response, _ = await service.chat(request)
-
-            assert "https://weather.com/seoul" in response.sources
-
-    @pytest.mark.asyncio
-    async def test_chat_saves_messages_to_db(
-        self, mock_llm: MagicMock, mock_chat_repo: MagicMock
-    ) -> None:
-        with patch(
-            "app.services.agent_service.create_react_agent"
-        ) as mock_create_agent:
-            mock_agent = MagicMock()
-            mock_agent.ainvoke = AsyncMock(
-                return_value={
-                    "messages": [
-                        HumanMessage(content="Hello"),
-                        AIMessage(content="Hi!"),
-                    ]
-                }
-            )
-            mock_create_agent.return_value = mock_agent
-
-            service = AgentService(llm=mock_llm, chat_repo=mock_chat_repo, user_id=1)
-            request = ChatRequest(message="Hello")
-            await service.chat(request)
-
-            mock_chat_repo.create_messages_bulk.assert_called_once()
-
-
-class TestAgentServiceStreamChat:
-    """Tests for AgentService.stream_chat method."""
-
-    @pytest.mark.asyncio
-    async def test_stream_chat_yields_events(
-        self, mock_llm: MagicMock, mock_chat_repo: MagicMock
-    ) -> None:
-        with patch(
-            "app.services.agent_service.create_react_agent"
-        ) as mock_create_agent:
-            mock_agent = MagicMock()
-
-            async def mock_astream_events(*args, **kwargs):
-                yield {
-                    "event": "on_chat_model_stream",
-                    "data": {"chunk": AIMessage(content="Hello")},
-                }
-                yield {
-                    "event": "on_chat_model_end",
-                    "data": {"output": AIMessage(content="Hello")},
-                }
-
-            mock_agent.astream_events = mock_astream_events
-            mock_state = MagicMock()
-            mock_state.values = {
-                "messages": [HumanMessage(content="Hello"), AIMessage(content="Hello")]
-            }
-            mock_agent.aget_state = AsyncMock(return_value=mock_state)
-            mock_create_agent.return_value = mock_agent
-
-            service = AgentService(llm=mock_llm, chat_repo=mock_chat_repo, user_id=1)
-            request = ChatRequest(message="Hello")
-
-            events = []
-            async for event in service.stream_chat(request):
-                events.append(event)
-
-            assert len(events) > 0
-            assert all(isinstance(e, StreamEvent) for e in events)
-
-    @pytest.mark.asyncio
-    async def test_stream_chat_ends_with_done_event(
-        self, mock_llm: MagicMock, mock_chat_repo: MagicMock
-    ) -> None:
-        with patch(
-            "app.services.agent_service.create_react_agent"
-        ) as mock_create_agent:
-            mock_agent = MagicMock()
-
-            async def mock_astream_events(*args, **kwargs):
-                yield {
-                    "event": "on_chat_model_stream",
-                    "data": {"chunk": AIMessage(content="Hi")},
-                }
-
-            mock_agent.astream_events = mock_astream_events
-            mock_state = MagicMock()
-            mock_state.values = {
-                "messages": [HumanMessage(content="Hello"), AIMessage(content="Hi")]
-            }
-            mock_agent.aget_state = AsyncMock(return_value=mock_state)
-            mock_create_agent.return_value = mock_agent
-
-            service = AgentService(llm=mock_llm, chat_repo=mock_chat_repo, user_id=1)
-            request = ChatRequest(message="Hello")
-
-            events = []
-            async for event in service.stream_chat(request):
-                events.append(event)
-
-            assert events[-1].event == "done"
-
-    @pytest.mark.asyncio
-    async def test_stream_chat_done_event_includes_message_ids(
-        self, mock_llm: MagicMock, mock_chat_repo: MagicMock
-    ) -> None:
-        with patch(
-            "app.services.agent_service.create_react_agent"
-        ) as mock_create_agent:
-            mock_agent = MagicMock()
-
-            async def mock_astream_events(*args, **kwargs):
-                yield {
-                    "event": "on_chat_model_stream",
-                    "data": {"chunk": AIMessage(content="Hi")},
-                }
-
-            mock_agent.astream_events = mock_astream_events
-            mock_state = MagicMock()
-            mock_state.values = {
-                "messages": [HumanMessage(content="Hello"), AIMessage(content="Hi")]
-            }
-            mock_agent.aget_state = AsyncMock(return_value=mock_state)
-            mock_create_agent.return_value = mock_agent
-
-            service = AgentService(llm=mock_llm, chat_repo=mock_chat_repo, user_id=1)
-            request = ChatRequest(message="Hello")
-
-            events = []
-            async for event in service.stream_chat(request):
-                events.append(event)
-
-            done_data = json.loads(events[-1].data)
-            assert "user_message_id" in done_data
-            assert "ai_message_id" in done_data
-
-    @pytest.mark.asyncio
-    async def test_stream_chat_yields_token_events(
-        self, mock_llm: MagicMock, mock_chat_repo: MagicMock
-    ) -> None:
-        with patch(
-            "app.services.agent_service.create_react_agent"
-        ) as mock_create_agent:
-            mock_agent = MagicMock()
-
-            async def mock_astream_events(*args, **kwargs):
-                yield {
-                    "event": "on_chat_model_stream",
-                    "data": {"chunk": AIMessage(content="Hello")},
-                }
-                yield {
-                    "event": "on_chat_model_stream",
-                    "data": {"chunk": AIMessage(content=" world")},
-                }
-
-            mock_agent.astream_events = mock_astream_events
-            mock_state = MagicMock()
-            mock_state.values = {
+        patched_agent.ainvoke = AsyncMock(
+            return_value={
                 "messages": [
-                    HumanMessage(content="Hi"),
-                    AIMessage(content="Hello world"),
+                    HumanMessage(content="Search for weather"),
+                    ToolMessage(
+                        content="[link: https://weather.com/seoul]",
+                        tool_call_id="call_1",
+                    ),
+                    AIMessage(content="The weather is sunny."),
                 ]
             }
-            mock_agent.aget_state = AsyncMock(return_value=mock_state)
-            mock_create_agent.return_value = mock_agent
+        )
 
-            service = AgentService(llm=mock_llm, chat_repo=mock_chat_repo, user_id=1)
-            request = ChatRequest(message="Hi")
+        request = ChatRequest.model_construct(message="Search for weather")
 
-            token_events = []
-            async for event in service.stream_chat(request):
-                if event.event == "token":
-                    token_events.append(event)
+        response, _ = await service.chat(request)
 
-            assert len(token_events) >= 1
+        assert "https://weather.com/seoul" in response.sources
 
-    @pytest.mark.asyncio
-    async def test_stream_chat_yields_tool_events(
-        self, mock_llm: MagicMock, mock_chat_repo: MagicMock
+    async def test_chat_saves_messages_to_db(
+        self,
+        service: AgentService,
+        mock_chat_repo: MagicMock,
     ) -> None:
-        with patch(
-            "app.services.agent_service.create_react_agent"
-        ) as mock_create_agent:
-            mock_agent = MagicMock()
-
-            async def mock_astream_events(*args, **kwargs):
-                yield {
-                    "event": "on_tool_start",
-                    "name": "web_search",
-                    "data": {"input": {"query": "test"}},
-                }
-                yield {
-                    "event": "on_tool_end",
-                    "name": "web_search",
-                    "run_id": "run_1",
-                    "data": {"output": "Search results..."},
-                }
-
-            mock_agent.astream_events = mock_astream_events
-            mock_state = MagicMock()
-            mock_state.values = {
-                "messages": [
-                    HumanMessage(content="Search test"),
-                    AIMessage(content=""),
-                ]
-            }
-            mock_agent.aget_state = AsyncMock(return_value=mock_state)
-            mock_create_agent.return_value = mock_agent
-
-            service = AgentService(llm=mock_llm, chat_repo=mock_chat_repo, user_id=1)
-            request = ChatRequest(message="Search test")
-
-            tool_events = []
-            async for event in service.stream_chat(request):
-                if event.event in ("tool_call", "tool_result"):
-                    tool_events.append(event)
-
-            assert len(tool_events) >= 1
+        request = ChatRequest.model_construct(message="Hello")
+        await service.chat(request)
+
+        mock_chat_repo.insert_messages_bulk.assert_called_once()
+        rows = mock_chat_repo.insert_messages_bulk.call_args[0][0]
+        assert [(r["role"], r["content"]) for r in rows] == [
+            ("human", "Hello"),
+            ("ai", "Hi!"),
+        ]
+        mock_chat_repo.create_messages_bulk.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_stream_chat_saves_messages_to_db(
-        self, mock_llm: MagicMock, mock_chat_repo: MagicMock
+    async def test_chat_existing_session_loads_history_in_one_query(
+        self,
+        service: AgentService,
+        mock_chat_repo: MagicMock,
+        patched_agent: SimpleNamespace,
     ) -> None:
-        with patch(
-            "app.services.agent_service.create_react_agent"
-        ) as mock_create_agent:
-            mock_agent = MagicMock()
-
-            async def mock_astream_events(*args, **kwargs):
-                yield {
-                    "event": "on_chat_model_stream",
-                    "data": {"chunk": AIMessage(content="Done")},
-                }
+        session_mock = _FakeSession(id=7)
+        history = [
+            ChatMessage(id=1, session_id=7, role="human", content="Q1"),
+            ChatMessage(id=2, session_id=7, role="ai", content="A1"),
+        ]
+        mock_chat_repo.find_session_with_messages.return_value = (session_mock, history)
 
-            mock_agent.astream_events = mock_astream_events
-            mock_state = MagicMock()
-            mock_state.values = {
+        patched_agent.ainvoke = AsyncMock(
+            return_value={
                 "messages": [
-                    HumanMessage(content="Hello"),
-                    AIMessage(content="Done"),
+                    HumanMessage(content="Q1"),
+                    AIMessage(content="A1"),
+                    HumanMessage(content="Q2"),
+                    AIMessage(content="A2"),
                 ]
             }
-            mock_agent.aget_state = AsyncMock(return_value=mock_state)
-            mock_create_agent.return_value = mock_agent
-
-            service = AgentService(llm=mock_llm, chat_repo=mock_chat_repo, user_id=1)
-            request = ChatRequest(message="Hello")
-
-            async for _ in service.stream_chat(request):
-                pass
-
-            mock_chat_repo.create_messages_bulk.assert_called_once()
-
-
-class TestValidateMessageOwnership:
-    """Tests for AgentService._validate_message_ownership."""
-
-    @pytest.mark.asyncio
-    async def test_session_not_found(
-        self, mock_llm: MagicMock, mock_chat_repo: MagicMock
-    ) -> None:
-        mock_chat_repo.find_session_by_conversation_id = AsyncMock(return_value=None)
-
-        with patch(
-            "app.services.agent_service.create_react_agent"
-        ) as mock_create_agent:
-            mock_create_agent.return_value = MagicMock()
-            service = AgentService(llm=mock_llm, chat_repo=mock_chat_repo, user_id=1)
-
-            with pytest.raises(SessionNotFoundError):
-                await service._validate_message_ownership("conv-x", 1, "ai")
-
-    @pytest.mark.asyncio
-    async def test_not_authorized(
-        self, mock_llm: MagicMock, mock_chat_repo: MagicMock
-    ) -> None:
-        session_mock = MagicMock()
-        session_mock.id = 1
-        session_mock.user_id = 999
-        mock_chat_repo.find_session_by_conversation_id = AsyncMock(
-            return_value=session_mock
         )
 
-        with patch(
-            "app.services.agent_service.create_react_agent"
-        ) as mock_create_agent:
-            mock_create_agent.return_value = MagicMock()
-            service = AgentService(llm=mock_llm, chat_repo=mock_chat_repo, user_id=1)
-
-            with pytest.raises(AuthorizationError):
-                await service._validate_message_ownership("conv-x", 1, "ai")
-
-    @pytest.mark.asyncio
-    async def test_message_not_found(
-        self, mock_llm: MagicMock, mock_chat_repo: MagicMock
-    ) -> None:
-        session_mock = MagicMock()
-        session_mock.id = 1
-        session_mock.user_id = 1
-        mock_chat_repo.find_session_by_conversation_id = AsyncMock(
-            return_value=session_mock
+        request = ChatRequest.model_construct(
+            message="Q2", conversation_id="existing-conv"
         )
-        mock_chat_repo.find_message_by_id = AsyncMock(return_value=None)
-
-        with patch(
-            "app.services.agent_service.create_react_agent"
-        ) as mock_create_agent:
-            mock_create_agent.return_value = MagicMock()
-            service = AgentService(llm=mock_llm, chat_repo=mock_chat_repo, user_id=1)
 
-            with pytest.raises(MessageNotFoundError):
-                await service._validate_message_ownership("conv-x", 1, "ai")
+        response, is_new = await service.chat(request)
 
-    @pytest.mark.asyncio
-    async def test_message_wrong_session(
-        self, mock_llm: MagicMock, mock_chat_repo: MagicMock
-    ) -> None:
-        session_mock = MagicMock()
-        session_mock.id = 1
-        session_mock.user_id = 1
-        mock_chat_repo.find_session_by_conversation_id = AsyncMock(
-            return_value=session_mock
+        assert is_new is False
+        assert response.session_id == 7
+        assert response.message == "A2"
+        mock_chat_repo.find_session_with_messages.assert_awaited_once_with(
+            "existing-conv"
         )
+        mock_chat_repo.create_session.assert_not_called()
+        mock_chat_repo.find_messages_by_session_id.assert_not_called()
+        input_messages = patched_agent.ainvoke.call_args[0][0]["messages"]
+        assert [m.content for m in input_messages] == ["Q1", "A1", "Q2"]
 
-        msg_mock = MagicMock()
-        msg_mock.session_id = 999  # Different session
-        msg_mock.role = "ai"
-        mock_chat_repo.find_message_by_id = AsyncMock(return_value=msg_mock)
-
-        with patch(
-            "app.services.agent_service.create_react_agent"
-        ) as mock_create_agent:
-            mock_create_agent.return_value = MagicMock()
-            service = AgentService(llm=mock_llm, chat_repo=mock_chat_repo, user_id=1)
 
-            with pytest.raises(AppException) as exc_info:
-                await service._validate_message_ownership("conv-x", 1, "ai")
-            assert exc_info.value.code == "MESSAGE_OWNERSHIP_ERROR"
+class TestAgentServiceStreamChat:
+    """Tests for AgentService.stream_chat method."""
 
-    @pytest.mark.asyncio
-    async def test_wrong_message_role(
-        self, mock_llm: MagicMock, mock_chat_repo: MagicMock
+    @pytest.mark.parametrize(
+        ("events", "final_ai", "expected"),
+        [
+            (
+                (
+                    {"event": "on_chat_model_stream", "data": {"chunk": _HELLO_AI}},
+                    {"event": "on_chat_model_end", "data": {"output": _HELLO_AI}},
+                ),
+                _HELLO_AI,
+                [("token", "Hello")],
+            ),
+            (_HI_STREAM, _HI_AI_CHUNK, [("token", "Hi")]),
+            (
+                (
+                    {"event": "on_chat_model_stream", "data": {"chunk": _HELLO_AI}},
+                    {
+                        "event": "on_chat_model_stream",
+                        "data": {"chunk": AIMessage(content=" world")},
+                    },
+                ),
+                AIMessage(content="Hello world"),
+                [("token", "Hello"), ("token", " world")],
+            ),
+            (
+                (
+                    {
+                        "event": "on_tool_start",
+                        "name": "web_search",
+                        "data": {"input": {"query": "test"}},
+                    },
+                    {
+                        "event": "on_tool_end",
+                        "name": "web_search",
+                        "run_id": "run_1",
+                        "data": {"output": "Search results..."},
+                    },
+                ),
+                AIMessage(content=""),
+                [
+                    ("tool_call", "web_search: {'query': 'test'}"),
+                    ("tool_result", "Search results..."),
+                ],
+            ),
+        ],
+        ids=[
+            "model_end_ignored",
+            "single_token",
+            "token_events",
+            "tool_events",
+        ],
+    )
+    async def test_stream_chat_events(
+        self,
+        service: AgentService,
+        patched_agent: SimpleNamespace,
+        events: tuple[dict[str, Any], ...],
+        final_ai: AIMessage,
+        expected: list[tuple[str, str]],
     ) -> None:
-        session_mock = MagicMock()
-        session_mock.id = 1
-        session_mock.user_id = 1
-        mock_chat_repo.find_session_by_conversation_id = AsyncMock(
-            return_value=session_mock
-        )
+        patched_agent.astream_events = _StreamEvents(*events)
+        patched_agent.aget_state.return_value.values = {
+            "messages": [_HELLO_HUMAN, final_ai]
+        }
 
-        msg_mock = MagicMock()
-        msg_mock.session_id = 1
-        msg_mock.role = "human"  # Expected "ai"
-        mock_chat_repo.find_message_by_id = AsyncMock(return_value=msg_mock)
+        request = ChatRequest.model_construct(message="Hello")
+        stream = [event async for event in service.stream_chat(request)]
 
-        with patch(
-            "app.services.agent_service.create_react_agent"
-        ) as mock_create_agent:
-            mock_create_agent.return_value = MagicMock()
-            service = AgentService(llm=mock_llm, chat_repo=mock_chat_repo, user_id=1)
+        assert [e.event for e in stream] == [*(name for name, _ in expected), "done"]
+        assert [e.data for e in stream[:-1]] == [data for _, data in expected]
 
-            with pytest.raises(AppException) as exc_info:
-                await service._validate_message_ownership("conv-x", 1, "ai")
-            assert exc_info.value.code == "INVALID_MESSAGE_ROLE"
+        done_data = orjson.loads(stream[-1].data)
+        assert done_data["session_id"] == 1
+        assert done_data["is_new_session"] is True
+        assert {"user_message_id", "ai_message_id"} <= done_data.keys()
 
-    @pytest.mark.asyncio
-    async def test_valid_ownership(
-        self, mock_llm: MagicMock, mock_chat_repo: MagicMock
+    async def test_stream_chat_saves_messages_to_db(
+        self,
+        service: AgentService,
+        mock_chat_repo: MagicMock,
     ) -> None:
-        session_mock = MagicMock()
-        session_mock.id = 1
-        session_mock.user_id = 1
-        mock_chat_repo.find_session_by_conversation_id = AsyncMock(
-            return_value=session_mock
-        )
+        request = ChatRequest.model_construct(message="Hello")
 
-        msg_mock = MagicMock()
-        msg_mock.session_id = 1
-        msg_mock.role = "ai"
-        mock_chat_repo.find_message_by_id = AsyncMock(return_value=msg_mock)
+        async for _ in service.stream_chat(request):
+            pass
 
-        with patch(
-            "app.services.agent_service.create_react_agent"
-        ) as mock_create_agent:
-            mock_create_agent.return_value = MagicMock()
-            service = AgentService(llm=mock_llm, chat_repo=mock_chat_repo, user_id=1)
-
-            session, message = await service._validate_message_ownership(
-                "conv-x", 1, "ai"
-            )
-            assert session is session_mock
-            assert message is msg_mock
+        mock_chat_repo.create_messages_bulk.assert_called_once()
 
 
-class TestStreamRegenerate:
-    """Tests for AgentService.stream_regenerate."""
+class TestProcessStreamEvent:
+    """Tests for AgentService._process_stream_event."""
 
-    @pytest.mark.asyncio
-    async def test_stream_regenerate_yields_events(
-        self, mock_llm: MagicMock, mock_chat_repo: MagicMock
+    def test_tool_result_str_output_truncated(
+        self, agent_service: AgentService
     ) -> None:
-        session_mock = MagicMock()
-        session_mock.id = 1
-        session_mock.user_id = 1
-        mock_chat_repo.find_session_by_conversation_id = AsyncMock(
-            return_value=session_mock
-        )
-
-        msg_mock = MagicMock()
-        msg_mock.session_id = 1
-        msg_mock.role = "ai"
-        mock_chat_repo.find_message_by_id = AsyncMock(return_value=msg_mock)
-        mock_chat_repo.delete_messages_from_id = AsyncMock()
+        event = {"event": "on_tool_end", "data": {"output": "x" * 10_000}}
+        result = agent_service._process_stream_event(event)
 
-        human_msg = ChatMessage(id=1, session_id=1, role="human", content="Hello")
-        mock_chat_repo.find_messages_by_session_id = AsyncMock(return_value=[human_msg])
+        assert result is not None
+        assert result.event == "tool_result"
+        assert result.data == "x" * TOOL_RESULT_MAX_CHARS
 
-        with patch(
-            "app.services.agent_service.create_react_agent"
-        ) as mock_create_agent:
-            mock_agent = MagicMock()
-
-            async def mock_astream_events(*args, **kwargs):
-                yield {
-                    "event": "on_chat_model_stream",
-                    "data": {"chunk": AIMessage(content="Regenerated!")},
-                }
-
-            mock_agent.astream_events = mock_astream_events
-            mock_state = MagicMock()
-            mock_state.values = {
-                "messages": [
-                    HumanMessage(content="Hello"),
-                    AIMessage(content="Regenerated!"),
-                ]
-            }
-            mock_agent.aget_state = AsyncMock(return_value=mock_state)
-            mock_create_agent.return_value = mock_agent
-
-            service = AgentService(llm=mock_llm, chat_repo=mock_chat_repo, user_id=1)
-
-            events = []
-            async for event in service.stream_regenerate("conv-123", 2):
-                events.append(event)
+    def test_tool_result_non_str_output_stringified(
+        self, agent_service: AgentService
+    ) -> None:
+        output = ToolMessage(content="y" * 10_000, tool_call_id="c1")
+        event = {"event": "on_tool_end", "data": {"output": output}}
+        result = agent_service._process_stream_event(event)
 
-            assert len(events) >= 2  # at least token + done
-            assert events[-1].event == "done"
+        assert result is not None
+        assert result.data == str(output)[:TOOL_RESULT_MAX_CHARS]
 
-            done_data = json.loads(events[-1].data)
-            assert "user_message_id" in done_data
-            assert "ai_message_id" in done_data
+    def test_unknown_event_returns_none(self, agent_service: AgentService) -> None:
+        assert agent_service._process_stream_event({"event": "on_chain_end"}) is None
 
 
-class TestStreamEdit:
-    """Tests for AgentService.stream_edit."""
+class TestValidateMessageOwnership:
+    """Tests for AgentService._validate_message_ownership."""
 
-    @pytest.mark.asyncio
-    async def test_stream_edit_yields_events(
-        self, mock_llm: MagicMock, mock_chat_repo: MagicMock
+    @pytest.mark.parametrize(
+        ("session", "message", "expected_exc", "expected_code"),
+        [
+            (None, None, SessionNotFoundError, "SESSION_NOT_FOUND"),
+            (
+                _FakeSession(id=1, user_id=999),
+                None,
+                AuthorizationError,
+                "AUTHORIZATION_ERROR",
+            ),
+            (
+                _FakeSession(id=1, user_id=1),
+                None,
+                MessageNotFoundError,
+                "MESSAGE_NOT_FOUND",
+            ),
+            (
+                _FakeSession(id=1, user_id=1),
+                _FakeMessage(session_id=999, role="ai"),
+                AppException,
+                "MESSAGE_OWNERSHIP_ERROR",
+            ),
+            (
+                _FakeSession(id=1, user_id=1),
+                _FakeMessage(session_id=1, role="human"),
+                AppException,
+                "INVALID_MESSAGE_ROLE",
+            ),
+        ],
+        ids=[
+            "session_not_found",
+            "not_authorized",
+            "message_not_found",
+            "message_wrong_session",
+            "wrong_message_role",
+        ],
+    )
+    async def test_rejects_invalid_ownership(
+        self,
+        service: AgentService,
+        mock_chat_repo: MagicMock,
+        session: _FakeSession | None,
+        message: _FakeMessage | None,
+        expected_exc: type[AppException],
+        expected_code: str,
     ) -> None:
-        session_mock = MagicMock()
-        session_mock.id = 1
-        session_mock.user_id = 1
-        mock_chat_repo.find_session_by_conversation_id = AsyncMock(
-            return_value=session_mock
-        )
+        mock_chat_repo.find_session_by_conversation_id.return_value = session
+        mock_chat_repo.find_message_by_id.return_value = message
 
-        msg_mock = MagicMock()
-        msg_mock.session_id = 1
-        msg_mock.role = "human"
-        mock_chat_repo.find_message_by_id = AsyncMock(return_value=msg_mock)
-        mock_chat_repo.delete_messages_from_id = AsyncMock()
-        mock_chat_repo.find_messages_by_session_id = AsyncMock(return_value=[])
+        with pytest.raises(expected_exc) as exc_info:
+            await service._validate_message_ownership("conv-x", 1, "ai")
+        assert exc_info.value.code == expected_code
 
-        with patch(
-            "app.services.agent_service.create_react_agent"
-        ) as mock_create_agent:
-            mock_agent = MagicMock()
-
-            async def mock_astream_events(*args, **kwargs):
-                yield {
-                    "event": "on_chat_model_stream",
-                    "data": {"chunk": AIMessage(content="Edited response!")},
-                }
-
-            mock_agent.astream_events = mock_astream_events
-            mock_state = MagicMock()
-            mock_state.values = {
-                "messages": [
-                    HumanMessage(content="New question"),
-                    AIMessage(content="Edited response!"),
-                ]
-            }
-            mock_agent.aget_state = AsyncMock(return_value=mock_state)
-            mock_create_agent.return_value = mock_agent
+    async def test_valid_ownership(
+        self,
+        service: AgentService,
+        mock_chat_repo: MagicMock,
+    ) -> None:
+        session = _FakeSession(id=1, user_id=1)
+        message = _FakeMessage(session_id=1, role="ai")
+        mock_chat_repo.find_session_by_conversation_id.return_value = session
+        mock_chat_repo.find_message_by_id.return_value = message
+
+        result = await service._validate_message_ownership("conv-x", 1, "ai")
+        assert result == (session, message)
+
+
+class TestStreamRegenerateAndEdit:
+    """Tests for AgentService.stream_regenerate and AgentService.stream_edit."""
+
+    @pytest.mark.parametrize(
+        ("method", "args", "target_role", "history", "final_messages"),
+        [
+            (
+                "stream_regenerate",
+                ("conv-123", 2),
+                "ai",
+                [_HELLO_DB_MESSAGE],
+                [_HELLO_HUMAN, _REGENERATED_AI],
+            ),
+            (
+                "stream_edit",
+                ("conv-123", 1, "New question"),
+                "human",
+                [],
+                [_NEW_QUESTION_HUMAN, _EDITED_AI],
+            ),
+        ],
+        ids=["regenerate", "edit"],
+    )
+    async def test_yields_events_ending_with_done(
+        self,
+        service: AgentService,
+        mock_chat_repo: MagicMock,
+        patched_agent: SimpleNamespace,
+        method: str,
+        args: tuple[Any, ...],
+        target_role: str,
+        history: list[ChatMessage],
+        final_messages: list[BaseMessage],
+    ) -> None:
+        mock_chat_repo.find_session_by_conversation_id.return_value = _FakeSession()
+        mock_chat_repo.find_message_by_id.return_value = _FakeMessage(role=target_role)
+        mock_chat_repo.find_messages_by_session_id.return_value = history
 
-            service = AgentService(llm=mock_llm, chat_repo=mock_chat_repo, user_id=1)
+        final_ai = final_messages[-1]
+        patched_agent.astream_events = _StreamEvents(
+            {"event": "on_chat_model_stream", "data": {"chunk": final_ai}},
+        )
+        patched_agent.aget_state.return_value.values = {"messages": final_messages}
 
-            events = []
-            async for event in service.stream_edit("conv-123", 1, "New question"):
-                events.append(event)
+        events = [event async for event in getattr(service, method)(*args)]
 
-            assert len(events) >= 2
-            assert events[-1].event == "done"
+        assert [e.event for e in events] == ["token", "done"]
+        assert events[0].data == final_ai.content
 
-            done_data = json.loads(events[-1].data)
-            assert "user_message_id" in done_data
-            assert "ai_message_id" in done_data
+        done_data = orjson.loads(events[-1].data)
+        assert done_data["conversation_id"] == "conv-123"
+        assert done_data["session_id"] == 1
+        assert {"user_message_id", "ai_message_id"} <= done_data.keys()
 
 
 class TestExtractMessageIds:
     """Tests for AgentService._extract_message_ids."""
 
     def test_extract_both_ids(self) -> None:
-        records = [
-            ChatMessage(id=10, session_id=1, role="human", content="Q"),
-            ChatMessage(id=11, session_id=1, role="ai", content="A"),
-        ]
-        user_id, ai_id = AgentService._extract_message_ids(records)
+        user_id, ai_id = AgentService._extract_message_ids(
+            [_QUESTION_RECORD, _ANSWER_RECORD]
+        )
         assert user_id == 10
         assert ai_id == 11
 
     def test_extract_no_ai_message(self) -> None:
-        records = [
-            ChatMessage(id=10, session_id=1, role="human", content="Q"),
-        ]
-        user_id, ai_id = AgentService._extract_message_ids(records)
+        user_id, ai_id = AgentService._extract_message_ids([_QUESTION_RECORD])
         assert user_id == 10
         assert ai_id is None
 
@@ -769,49 +665,63 @@ class TestExtractAiMessageId:
     """Tests for AgentService._extract_ai_message_id."""
 
     def test_extract_ai_id(self) -> None:
-        records = [
-            ChatMessage(id=5, session_id=1, role="tool", content="result"),
-            ChatMessage(id=6, session_id=1, role="ai", content="Answer"),
-        ]
+        records = [_TOOL_RECORD, _FINAL_ANSWER_RECORD]
         assert AgentService._extract_ai_message_id(records) == 6
 
     def test_no_ai_message(self) -> None:
-        records = [
-            ChatMessage(id=5, session_id=1, role="tool", content="result"),
-        ]
-        assert AgentService._extract_ai_message_id(records) is None
+        assert AgentService._extract_ai_message_id([_TOOL_RECORD]) is None
 
 
 class TestBuildLangchainMessages:
     """Tests for AgentService._build_langchain_messages static method."""
 
-    def test_build_human_message(self) -> None:
-        db_msg = ChatMessage(id=1, session_id=1, role="human", content="Hello")
-        result = AgentService._build_langchain_messages([db_msg])
-
-        assert len(result) == 1
-        assert isinstance(result[0], HumanMessage)
-        assert result[0].content == "Hello"
-
-    def test_build_ai_message_without_tool_calls(self) -> None:
-        db_msg = ChatMessage(id=2, session_id=1, role="ai", content="Hi there!")
+    @pytest.mark.parametrize(
+        ("db_msg", "expected_cls", "expected_attrs"),
+        [
+            (_HELLO_DB_MESSAGE, HumanMessage, {}),
+            (
+                ChatMessage(id=1, session_id=1, role="ai", content="Hi there!"),
+                AIMessage,
+                {"tool_calls": []},
+            ),
+            (
+                ChatMessage(
+                    id=1, session_id=1, role="system", content="You are helpful."
+                ),
+                SystemMessage,
+                {},
+            ),
+            (
+                ChatMessage(
+                    id=1,
+                    session_id=1,
+                    role="tool",
+                    content="Search result",
+                    tool_call_id="call_1",
+                    tool_name="web_search",
+                ),
+                ToolMessage,
+                {"tool_call_id": "call_1", "name": "web_search"},
+            ),
+        ],
+        ids=["human", "ai_without_tool_calls", "system", "tool"],
+    )
+    def test_build_single_role_message(
+        self,
+        db_msg: ChatMessage,
+        expected_cls: type,
+        expected_attrs: dict[str, Any],
+    ) -> None:
         result = AgentService._build_langchain_messages([db_msg])
 
         assert len(result) == 1
-        assert isinstance(result[0], AIMessage)
-        assert result[0].content == "Hi there!"
-        assert result[0].tool_calls == []
+        assert isinstance(result[0], expected_cls)
+        assert result[0].content == db_msg.content
+        for attr, value in expected_attrs.items():
+            assert getattr(result[0], attr) == value
 
     def test_build_ai_message_with_tool_calls(self) -> None:
-        tool_calls = [{"name": "web_search", "args": {"query": "test"}, "id": "call_1"}]
-        db_msg = ChatMessage(
-            id=3,
-            session_id=1,
-            role="ai",
-            content="",
-            tool_calls_json=json.dumps(tool_calls),
-        )
-        result = AgentService._build_langchain_messages([db_msg])
+        result = AgentService._build_langchain_messages([_TOOL_CALL_DB_MESSAGE])
 
         assert len(result) == 1
         assert isinstance(result[0], AIMessage)
@@ -820,40 +730,8 @@ class TestBuildLangchainMessages:
         assert result[0].tool_calls[0]["args"] == {"query": "test"}
         assert result[0].tool_calls[0]["id"] == "call_1"
 
-    def test_build_system_message(self) -> None:
-        db_msg = ChatMessage(
-            id=4, session_id=1, role="system", content="You are helpful."
-        )
-        result = AgentService._build_langchain_messages([db_msg])
-
-        assert len(result) == 1
-        assert isinstance(result[0], SystemMessage)
-        assert result[0].content == "You are helpful."
-
-    def test_build_tool_message(self) -> None:
-        db_msg = ChatMessage(
-            id=5,
-            session_id=1,
-            role="tool",
-            content="Search result",
-            tool_call_id="call_1",
-            tool_name="web_search",
-        )
-        result = AgentService._build_langchain_messages([db_msg])
-
-        assert len(result) == 1
-        assert isinstance(result[0], ToolMessage)
-        assert result[0].content == "Search result"
-        assert result[0].tool_call_id == "call_1"
-        assert result[0].name == "web_search"
-
     def test_build_multiple_messages_preserves_order(self) -> None:
-        db_messages = [
-            ChatMessage(id=1, session_id=1, role="human", content="Q1"),
-            ChatMessage(id=2, session_id=1, role="ai", content="A1"),
-            ChatMessage(id=3, session_id=1, role="human", content="Q2"),
-        ]
-        result = AgentService._build_langchain_messages(db_messages)
+        result = AgentService._build_langchain_messages(list(_ORDERED_DB_MESSAGES))
 
         assert len(result) == 3
         assert isinstance(result[0], HumanMessage)
@@ -865,30 +743,25 @@ class TestExtractNewMessages:
     """Tests for AgentService._extract_new_messages static method."""
 
     def test_extract_ai_message(self) -> None:
-        messages = [
-            HumanMessage(content="Hello"),
-            AIMessage(content="Hi!"),
-        ]
-        result = AgentService._extract_new_messages(messages, history_len=0)
+        result = AgentService._extract_new_messages(
+            [_HELLO_HUMAN, _HI_AI], history_len=0
+        )
 
         assert len(result) == 1
         assert result[0]["role"] == "ai"
         assert result[0]["content"] == "Hi!"
 
     def test_extract_ai_with_tool_calls(self) -> None:
-        ai_msg = AIMessage(
-            content="",
-            tool_calls=[{"name": "web_search", "args": {"query": "test"}, "id": "c1"}],
+        result = AgentService._extract_new_messages(
+            [_SEARCH_HUMAN, _SEARCH_TOOL_CALL], history_len=0
         )
-        messages = [HumanMessage(content="Search"), ai_msg]
-        result = AgentService._extract_new_messages(messages, history_len=0)
 
         assert len(result) == 1
         assert "tool_calls_json" in result[0]
 
     def test_extract_tool_message(self) -> None:
         messages = [
-            HumanMessage(content="Search"),
+            _SEARCH_HUMAN,
             ToolMessage(content="Results", tool_call_id="c1", name="search"),
             AIMessage(content="Here you go"),
         ]
@@ -1014,7 +887,7 @@ class TestConvertMessagesToDicts:
         assert len(result) == 1
         assert result[0]["role"] == "ai"
         assert "tool_calls_json" in result[0]
-        parsed = json.loads(result[0]["tool_calls_json"])
+        parsed = orjson.loads(result[0]["tool_calls_json"])
         assert parsed[0]["name"] == "search"
 
     def test_convert_tool_message(self) -> None:
@@ -1,5 +1,7 @@
 """Tests for AuthService."""
 
+from unittest.mock import AsyncMock
+
 import fakeredis.aioredis
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -23,7 +25,7 @@ from app.schemas.auth_schema import (
     TokenPayload,
 )
 from app.services.auth_service import AuthService
-from app.services.token_service import TokenService
+from app.services.token_service import REFRESH_LOCK_PREFIX, TokenService
 
 
 @pytest.fixture
@@ -141,6 +143,23 @@ class TestLogin:
                 LoginRequest(email="login@test.com", password="Test1234!")
             )
 
+    async def test_login_locked_skips_user_lookup(
+        self,
+        auth_service: AuthService,
+        fake_redis: fakeredis.aioredis.FakeRedis,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        ts = TokenService(fake_redis)
+        for _ in range(5):
+            await ts.record_failed_login("login@test.com")
+        find_by_email = AsyncMock()
+        monkeypatch.setattr(auth_service._user_repo, "find_by_email", find_by_email)
+        with pytest.raises(AccountLockedError):
+            await auth_service.login(
+                LoginRequest(email="login@test.com", password="Test1234!")
+            )
+        find_by_email.assert_not_awaited()
+
 
 class TestLogout:
     """Tests for user logout."""
@@ -208,3 +227,4 @@ class TestRefresh:
 
         with pytest.raises(TokenBlacklistedError):
             await auth_service.refresh(RefreshRequest(refresh_token=refresh_token))
+        assert await fake_redis.exists(f"{REFRESH_LOCK_PREFIX}{payload.jti}") == 0
@@ -25,11 +25,10 @@ async def _create_user(
     user = User(
         email=email,
         hashed_password="hashed",
-        username=email.split("@")[0],
+        username=email.partition("@")[0],
     )
     db_session.add(user)
     await db_session.flush()
-    await db_session.refresh(user)
     return user.id
 
 
@@ -49,14 +48,12 @@ async def _create_session_with_ts(
     )
     db_session.add(session)
     await db_session.flush()
-    await db_session.refresh(session)
     return session
 
 
 class TestCreateSession:
     """Tests for ChatRepository.create_session."""
 
-    @pytest.mark.asyncio
     async def test_create_session(
         self, chat_repo: ChatRepository, db_session: AsyncSession
     ) -> None:
@@ -70,7 +67,6 @@ class TestCreateSession:
         assert session.conversation_id == "conv-001"
         assert session.title is None
 
-    @pytest.mark.asyncio
     async def test_create_session_with_title(
         self, chat_repo: ChatRepository, db_session: AsyncSession
     ) -> None:
@@ -87,7 +83,6 @@ class TestCreateSession:
 class TestFindSessionByConversationId:
     """Tests for ChatRepository.find_session_by_conversation_id."""
 
-    @pytest.mark.asyncio
     async def test_find_existing_session(
         self, chat_repo: ChatRepository, db_session: AsyncSession
     ) -> None:
@@ -98,16 +93,59 @@ class TestFindSessionByConversationId:
         assert found is not None
         assert found.conversation_id == "conv-find"
 
-    @pytest.mark.asyncio
     async def test_find_nonexistent_session(self, chat_repo: ChatRepository) -> None:
         found = await chat_repo.find_session_by_conversation_id("no-such")
         assert found is None
 
 
+class TestFindSessionWithMessages:
+    """Tests for ChatRepository.find_session_with_messages."""
+
+    async def test_returns_session_and_ordered_messages(
+        self, chat_repo: ChatRepository, db_session: AsyncSession
+    ) -> None:
+        user_id = await _create_user(db_session)
+        session = await chat_repo.create_session(
+            user_id=user_id, conversation_id="conv-joined"
+        )
+        await chat_repo.create_message(
+            session_id=session.id, role="human", content="First"
+        )
+        await chat_repo.create_message(
+            session_id=session.id, role="ai", content="Second"
+        )
+
+        found, messages = await chat_repo.find_session_with_messages("conv-joined")
+
+        assert found is not None
+        assert found.id == session.id
+        assert [m.content for m in messages] == ["First", "Second"]
+
+    async def test_session_without_messages(
+        self, chat_repo: ChatRepository, db_session: AsyncSession
+    ) -> None:
+        user_id = await _create_user(db_session)
+        session = await chat_repo.create_session(
+            user_id=user_id, conversation_id="conv-joined-empty"
+        )
+
+        found, messages = await chat_repo.find_session_with_messages(
+            "conv-joined-empty"
+        )
+
+        assert found is not None
+        assert found.id == session.id
+        assert messages == []
+
+    async def test_nonexistent_session(self, chat_repo: ChatRepository) -> None:
+        found, messages = await chat_repo.find_session_with_messages("no-such")
+        assert found is None
+        assert messages == []
+
+
 class TestCreateMessage:
     """Tests for ChatRepository.create_message."""
 
-    @pytest.mark.asyncio
     async def test_create_human_message(
         self, chat_repo: ChatRepository, db_session: AsyncSession
     ) -> None:
@@ -125,7 +163,6 @@ class TestCreateMessage:
         assert msg.content == "Hello"
         assert msg.tool_calls_json is None
 
-    @pytest.mark.asyncio
     async def test_create_ai_message_with_tool_calls(
         self, chat_repo: ChatRepository, db_session: AsyncSession
     ) -> None:
@@ -144,7 +181,6 @@ class TestCreateMessage:
         assert msg.role == "ai"
         assert msg.tool_calls_json is not None
 
-    @pytest.mark.asyncio
     async def test_create_tool_message(
         self, chat_repo: ChatRepository, db_session: AsyncSession
     ) -> None:
@@ -169,7 +205,6 @@ class TestCreateMessage:
 class TestFindMessagesBySessionId:
     """Tests for ChatRepository.find_messages_by_session_id."""
 
-    @pytest.mark.asyncio
     async def test_find_messages_ordered_by_id(
         self, chat_repo: ChatRepository, db_session: AsyncSession
     ) -> None:
@@ -195,7 +230,6 @@ class TestFindMessagesBySessionId:
         assert messages[1].content == "Second"
         assert messages[2].content == "Third"
 
-    @pytest.mark.asyncio
     async def test_find_messages_empty_session(
         self, chat_repo: ChatRepository, db_session: AsyncSession
     ) -> None:
@@ -211,7 +245,6 @@ class TestFindMessagesBySessionId:
 class TestCreateMessagesBulk:
     """Tests for ChatRepository.create_messages_bulk."""
 
-    @pytest.mark.asyncio
     async def test_create_messages_bulk(
         self, chat_repo: ChatRepository, db_session: AsyncSession
     ) -> None:
@@ -231,10 +264,48 @@ class TestCreateMessagesBulk:
         assert len(messages) == 3
 
 
+class TestInsertMessagesBulk:
+    """Tests for ChatRepository.insert_messages_bulk."""
+
+    async def test_insert_messages_bulk(
+        self, chat_repo: ChatRepository, db_session: AsyncSession
+    ) -> None:
+        user_id = await _create_user(db_session)
+        session = await chat_repo.create_session(
+            user_id=user_id, conversation_id="conv-core-bulk"
+        )
+
+        rows = [
+            {
+                "session_id": session.id,
+                "role": "human",
+                "content": "Q1",
+                "tool_calls_json": None,
+                "tool_call_id": None,
+                "tool_name": None,
+            },
+            {
+                "session_id": session.id,
+                "role": "tool",
+                "content": "result",
+                "tool_calls_json": None,
+                "tool_call_id": "call_1",
+                "tool_name": "web_search",
+            },
+        ]
+        await chat_repo.insert_messages_bulk(rows)
+
+        messages = await chat_repo.find_messages_by_session_id(session.id)
+        assert [m.role for m in messages] == ["human", "tool"]
+        assert messages[1].tool_call_id == "call_1"
+
+    async def test_insert_messages_bulk_empty(self, chat_repo: ChatRepository) -> None:
+        await chat_repo.insert_messages_bulk([])
+
+
 class TestFindMessageById:
     """Tests for ChatRepository.find_message_by_id."""
 
-    @pytest.mark.asyncio
     async def test_find_existing_message(
         self, chat_repo: ChatRepository, db_session: AsyncSession
     ) -> None:
@@ -251,7 +322,6 @@ class TestFindMessageById:
         assert found.id == msg.id
         assert found.content == "Hello"
 
-    @pytest.mark.asyncio
     async def test_find_nonexistent_message(self, chat_repo: ChatRepository) -> None:
         found = await chat_repo.find_message_by_id(99999)
         assert found is None
@@ -260,7 +330,6 @@ class TestFindMessageById:
 class TestDeleteMessagesFromId:
     """Tests for ChatRepository.delete_messages_from_id."""
 
-    @pytest.mark.asyncio
     async def test_delete_messages_from_id(
         self, chat_repo: ChatRepository, db_session: AsyncSession
     ) -> None:
@@ -286,7 +355,6 @@ class TestDeleteMessagesFromId:
         assert remaining[0].content == "Q1"
         assert remaining[1].content == "A1"
 
-    @pytest.mark.asyncio
     async def test_delete_from_first_message(
         self, chat_repo: ChatRepository, db_session: AsyncSession
     ) -> None:
@@ -305,7 +373,6 @@ class TestDeleteMessagesFromId:
         remaining = await chat_repo.find_messages_by_session_id(session.id)
         assert len(remaining) == 0
 
-    @pytest.mark.asyncio
     async def test_delete_does_not_affect_other_sessions(
         self, chat_repo: ChatRepository, db_session: AsyncSession
     ) -> None:
@@ -335,7 +402,6 @@ class TestDeleteMessagesFromId:
 class TestUpdateSessionTitle:
     """Tests for ChatRepository.update_session_title."""
 
-    @pytest.mark.asyncio
     async def test_update_session_title(
         self, chat_repo: ChatRepository, db_session: AsyncSession
     ) -> None:
@@ -355,7 +421,6 @@ class TestUpdateSessionTitle:
 class TestFindSessionsByUser:
     """Tests for ChatRepository.find_sessions_by_user."""
 
-    @pytest.mark.asyncio
     async def test_empty_result(
         self, chat_repo: ChatRepository, db_session: AsyncSession
     ) -> None:
@@ -363,7 +428,6 @@ class TestFindSessionsByUser:
         rows = await chat_repo.find_sessions_by_user(user_id=user_id, limit=10)
         assert rows == []
 
-    @pytest.mark.asyncio
     async def test_filters_by_user_id(
         self, chat_repo: ChatRepository, db_session: AsyncSession
     ) -> None:
@@ -378,7 +442,6 @@ class TestFindSessionsByUser:
         assert len(rows) == 2
         assert all(r.conversation_id.startswith("conv-a") for r in rows)
 
-    @pytest.mark.asyncio
     async def test_order_by_updated_at_desc(
         self, chat_repo: ChatRepository, db_session: AsyncSession
     ) -> None:
@@ -394,7 +457,6 @@ class TestFindSessionsByUser:
         rows = await chat_repo.find_sessions_by_user(user_id=user_id, limit=10)
         assert [r.conversation_id for r in rows] == ["new", "mid", "old"]
 
-    @pytest.mark.asyncio
     async def test_limit_respected(
         self, chat_repo: ChatRepository, db_session: AsyncSession
     ) -> None:
@@ -406,7 +468,6 @@ class TestFindSessionsByUser:
         rows = await chat_repo.find_sessions_by_user(user_id=user_id, limit=3)
         assert len(rows) == 3
 
-    @pytest.mark.asyncio
     async def test_cursor_filtering(
         self, chat_repo: ChatRepository, db_session: AsyncSession
     ) -> None:
@@ -428,7 +489,6 @@ class TestFindSessionsByUser:
         )
         assert [r.conversation_id for r in rows] == ["c2", "c1"]
 
-    @pytest.mark.asyncio
     async def test_same_updated_at_tiebreak_by_id_desc(
         self, chat_repo: ChatRepository, db_session: AsyncSession
     ) -> None:
@@ -452,7 +512,6 @@ class TestFindSessionsByUser:
         assert len(rows) == 1
         assert rows[0].id == s1.id
 
-    @pytest.mark.asyncio
     async def test_preview_from_last_human_message(
         self, chat_repo: ChatRepository, db_session: AsyncSession
     ) -> None:
@@ -474,7 +533,6 @@ class TestFindSessionsByUser:
         assert len(rows) == 1
         assert rows[0].last_message_preview == "마지막 질문"
 
-    @pytest.mark.asyncio
     async def test_preview_none_when_no_messages(
         self, chat_repo: ChatRepository, db_session: AsyncSession
     ) -> None:
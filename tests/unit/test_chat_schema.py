@@ -1,6 +1,6 @@
 """Unit tests for chat schemas."""
 
-from datetime import datetime
+from datetime import UTC, datetime
 
 import pytest
 from pydantic import ValidationError
@@ -14,6 +14,8 @@ from app.schemas.chat_schema import (
     StreamEvent,
 )
 
+_NOW = datetime(2026, 1, 1, tzinfo=UTC)
+
 
 class TestChatMessage:
     """Tests for ChatMessage schema."""
@@ -85,19 +87,18 @@ class TestChatResponse:
 
     def test_valid_response(self) -> None:
         """Test creating a valid response."""
-        now = datetime.now()
         response = ChatResponse(
             message="Hello! How can I help?",
             conversation_id="test-123",
             session_id=1,
             sources=["https://example.com"],
-            created_at=now,
+            created_at=_NOW,
         )
         assert response.message == "Hello! How can I help?"
         assert response.conversation_id == "test-123"
         assert response.session_id == 1
         assert response.sources == ["https://example.com"]
-        assert response.created_at == now
+        assert response.created_at == _NOW
 
     def test_response_empty_sources(self) -> None:
         """Test response with empty sources list."""
@@ -106,7 +107,7 @@ class TestChatResponse:
             conversation_id="test-123",
             session_id=1,
             sources=[],
-            created_at=datetime.now(),
+            created_at=_NOW,
         )
         assert response.sources == []
 
@@ -116,7 +117,7 @@ class TestChatResponse:
             message="Hello!",
             conversation_id="test-123",
             session_id=1,
-            created_at=datetime.now(),
+            created_at=_NOW,
         )
         assert response.sources == []
 
@@ -41,17 +41,28 @@ class TestCursorEncoding:
         assert decoded_ts == ts
         assert decoded_id == 42
 
+    def test_cursor_is_unpadded(self) -> None:
+        ts = datetime(2026, 2, 8, 14, 30, 0, 123456, tzinfo=UTC)
+        cursor = encode_cursor(ts, 7)
+        assert "=" not in cursor
+        assert len(cursor) == 22
+        assert decode_cursor(cursor) == (ts, 7)
+
+    def test_naive_datetime_treated_as_utc(self) -> None:
+        naive = datetime(2026, 2, 8, 14, 30, 0, 999999)
+        decoded_ts, _ = decode_cursor(encode_cursor(naive, 1))
+        assert decoded_ts == naive.replace(tzinfo=UTC)
+
     def test_invalid_cursor_raises(self) -> None:
         with pytest.raises(AppException) as exc_info:
             decode_cursor("not-valid-base64!!!")
         assert exc_info.value.code == "INVALID_CURSOR"
         assert exc_info.value.status_code == 400
 
-    def test_missing_fields_raises(self) -> None:
+    def test_wrong_length_raises(self) -> None:
         import base64
-        import json
 
-        bad = base64.urlsafe_b64encode(json.dumps({"x": 1}).encode()).decode()
+        bad = base64.urlsafe_b64encode(b"\x00" * 8).decode()
         with pytest.raises(AppException) as exc_info:
             decode_cursor(bad)
         assert exc_info.value.code == "INVALID_CURSOR"
@@ -69,7 +80,6 @@ class TestConversationService:
     def service(self, mock_repo: ChatRepository) -> ConversationService:
         return ConversationService(chat_repo=mock_repo, user_id=1)
 
-    @pytest.mark.asyncio
     async def test_empty_list(
         self, service: ConversationService, mock_repo: AsyncMock
     ) -> None:
@@ -80,7 +90,6 @@ class TestConversationService:
         assert result.has_next is False
         assert result.next_cursor is None
 
-    @pytest.mark.asyncio
     async def test_single_page_no_next(
         self, service: ConversationService, mock_repo: AsyncMock
     ) -> None:
@@ -94,7 +103,6 @@ class TestConversationService:
         assert result.has_next is False
         assert result.next_cursor is None
 
-    @pytest.mark.asyncio
     async def test_has_next_page(
         self, service: ConversationService, mock_repo: AsyncMock
     ) -> None:
@@ -117,7 +125,6 @@ class TestConversationService:
         decoded_ts, decoded_id = decode_cursor(result.next_cursor)
         assert decoded_id == 2
 
-    @pytest.mark.asyncio
     async def test_cursor_passed_to_repo(
         self, service: ConversationService, mock_repo: AsyncMock
     ) -> None:
@@ -134,7 +141,6 @@ class TestConversationService:
             cursor_id=42,
         )
 
-    @pytest.mark.asyncio
     async def test_preview_forwarded(
         self, service: ConversationService, mock_repo: AsyncMock
     ) -> None:
@@ -157,7 +163,6 @@ class TestGetMessages:
     def service(self, mock_repo: AsyncMock) -> ConversationService:
         return ConversationService(chat_repo=mock_repo, user_id=1)
 
-    @pytest.mark.asyncio
     async def test_get_messages_success(
         self, service: ConversationService, mock_repo: AsyncMock
     ) -> None:
@@ -186,7 +191,6 @@ class TestGetMessages:
         mock_repo.find_session_by_conversation_id.assert_called_once_with("conv-123")
         mock_repo.find_messages_by_session_id.assert_called_once_with(10)
 
-    @pytest.mark.asyncio
     async def test_get_messages_empty(
         self, service: ConversationService, mock_repo: AsyncMock
     ) -> None:
@@ -201,7 +205,6 @@ class TestGetMessages:
         assert result.conversation_id == "conv-123"
         assert result.messages == []
 
-    @pytest.mark.asyncio
     async def test_get_messages_session_not_found(
         self, service: ConversationService, mock_repo: AsyncMock
     ) -> None:
@@ -210,7 +213,6 @@ class TestGetMessages:
         with pytest.raises(SessionNotFoundError):
             await service.get_messages("non-existent")
 
-    @pytest.mark.asyncio
     async def test_get_messages_not_authorized(
         self, service: ConversationService, mock_repo: AsyncMock
     ) -> None:
@@ -236,7 +238,6 @@ class TestUpdateTitle:
     def service(self, mock_repo: AsyncMock) -> ConversationService:
         return ConversationService(chat_repo=mock_repo, user_id=1)
 
-    @pytest.mark.asyncio
     async def test_update_title_success(
         self, service: ConversationService, mock_repo: AsyncMock
     ) -> None:
@@ -249,7 +250,6 @@ class TestUpdateTitle:
 
         mock_repo.update_session_title.assert_called_once_with(10, "새 제목")
 
-    @pytest.mark.asyncio
     async def test_update_title_session_not_found(
         self, service: ConversationService, mock_repo: AsyncMock
     ) -> None:
@@ -258,7 +258,6 @@ class TestUpdateTitle:
         with pytest.raises(SessionNotFoundError):
             await service.update_title("non-existent", "새 제목")
 
-    @pytest.mark.asyncio
     async def test_update_title_not_authorized(
         self, service: ConversationService, mock_repo: AsyncMock
     ) -> None:
@@ -1,6 +1,6 @@
 """Tests for password hashing utilities."""
 
-from app.core.security import DUMMY_HASH, hash_password, verify_password
+from app.core.security import dummy_hash, hash_password, verify_password
 
 
 class TestPasswordHashing:
@@ -14,8 +14,12 @@ class TestPasswordHashing:
         hashed = await hash_password("Correct1!")
         assert await verify_password("Wrong1!", hashed) is False
 
-    async def test_dummy_hash_exists(self) -> None:
-        assert DUMMY_HASH.startswith("$2")
+    def test_dummy_hash_uses_configured_rounds(self) -> None:
+        assert dummy_hash().startswith("$2b$04$")
 
     async def test_dummy_hash_does_not_match_real(self) -> None:
-        assert await verify_password("realpassword", DUMMY_HASH) is False
+        assert await verify_password("realpassword", dummy_hash()) is False
+
+    async def test_hash_uses_configured_rounds(self) -> None:
+        hashed = await hash_password("Rounds1!")
+        assert hashed.startswith("$2b$04$")
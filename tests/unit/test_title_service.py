@@ -4,9 +4,9 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from langchain_core.language_models import BaseChatModel
-from langchain_core.messages import AIMessage
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 
-from app.services.title_service import TitleService
+from app.services.title_service import TITLE_MAX_TOKENS, TitleService
 
 
 @pytest.fixture
@@ -14,13 +14,13 @@ def mock_llm() -> MagicMock:
     """Create a mock LLM for title generation."""
     mock = MagicMock(spec=BaseChatModel)
     mock.ainvoke = AsyncMock(return_value=AIMessage(content="날씨 질문"))
+    mock.bind.return_value = mock
     return mock
 
 
 class TestTitleService:
     """Tests for TitleService.generate_title."""
 
-    @pytest.mark.asyncio
     async def test_generate_title_returns_short_string(
         self, mock_llm: MagicMock
     ) -> None:
@@ -30,7 +30,6 @@ class TestTitleService:
         assert len(title) <= 20
         assert title == "날씨 질문"
 
-    @pytest.mark.asyncio
     async def test_generate_title_truncates_long_response(
         self,
     ) -> None:
@@ -40,23 +39,23 @@ class TestTitleService:
                 content="이것은매우긴제목입니다스무자를초과하는제목이다확인"
             )
         )
+        mock.bind.return_value = mock
 
         service = TitleService(mock)
         title = await service.generate_title("test")
 
         assert len(title) <= 20
 
-    @pytest.mark.asyncio
     async def test_generate_title_strips_whitespace(self) -> None:
         mock = MagicMock(spec=BaseChatModel)
         mock.ainvoke = AsyncMock(return_value=AIMessage(content="  제목  \n"))
+        mock.bind.return_value = mock
 
         service = TitleService(mock)
         title = await service.generate_title("test")
 
         assert title == "제목"
 
-    @pytest.mark.asyncio
     async def test_generate_title_calls_llm_with_prompt(
         self, mock_llm: MagicMock
     ) -> None:
@@ -64,6 +63,13 @@ class TestTitleService:
         await service.generate_title("Python이 뭐야?")
 
         mock_llm.ainvoke.assert_called_once()
-        prompt_arg = mock_llm.ainvoke.call_args[0][0]
-        assert "20자 이내" in prompt_arg
-        assert "Python이 뭐야?" in prompt_arg
+        system, human = mock_llm.ainvoke.call_args[0][0]
+        assert isinstance(system, SystemMessage)
+        assert "20자 이내" in system.content
+        assert isinstance(human, HumanMessage)
+        assert human.content == "Python이 뭐야?"
+
+    def test_generate_title_caps_output_tokens(self, mock_llm: MagicMock) -> None:
+        TitleService(mock_llm)
+
+        mock_llm.bind.assert_called_once_with(max_tokens=TITLE_MAX_TOKENS)
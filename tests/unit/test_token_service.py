@@ -6,7 +6,11 @@ import fakeredis.aioredis
 import pytest
 
 from app.core.exceptions import InvalidTokenError, TokenExpiredError
-from app.services.token_service import TokenService
+from app.services.token_service import (
+    LOGIN_ATTEMPTS_PREFIX,
+    LOGIN_LOCKOUT_SECONDS,
+    TokenService,
+)
 
 
 @pytest.fixture
@@ -33,7 +37,8 @@ class TestCreateTokens:
         assert payload.email == "test@test.com"
         assert payload.role == "user"
         assert payload.type == "access"
-        assert payload.jti is not None
+        assert len(payload.jti) == 32
+        assert "-" not in payload.jti
 
     def test_refresh_token_decodes_correctly(self, ts: TokenService) -> None:
         token = ts.create_refresh_token(user_id=10, email="r@r.com", role="admin")
@@ -96,6 +101,17 @@ class TestLoginAttempts:
         count = await ts.record_failed_login("inc@test.com")
         assert count == 2
 
+    async def test_lockout_window_set_on_first_attempt_only(
+        self, ts: TokenService, fake_redis: fakeredis.aioredis.FakeRedis
+    ) -> None:
+        key = f"{LOGIN_ATTEMPTS_PREFIX}ttl@test.com"
+        await ts.record_failed_login("ttl@test.com")
+        assert 0 < await fake_redis.ttl(key) <= LOGIN_LOCKOUT_SECONDS
+
+        await fake_redis.expire(key, 100)
+        await ts.record_failed_login("ttl@test.com")
+        assert await fake_redis.ttl(key) <= 100
+
     async def test_reset(self, ts: TokenService) -> None:
         await ts.record_failed_login("reset@test.com")
         await ts.reset_login_attempts("reset@test.com")
@@ -103,3 +119,20 @@ class TestLoginAttempts:
 
     async def test_zero_for_unknown(self, ts: TokenService) -> None:
         assert await ts.get_login_attempts("nobody@test.com") == 0
+
+
+class TestCheckAndLockRefresh:
+    """Tests for the combined blacklist check + refresh lock."""
+
+    async def test_acquires_lock_for_valid_token(self, ts: TokenService) -> None:
+        assert await ts.check_and_lock_refresh("jti-ok") == (False, True)
+        assert await ts.acquire_refresh_lock("jti-ok") is False
+
+    async def test_second_caller_does_not_get_lock(self, ts: TokenService) -> None:
+        await ts.check_and_lock_refresh("jti-race")
+        assert await ts.check_and_lock_refresh("jti-race") == (False, False)
+
+    async def test_reports_blacklisted(self, ts: TokenService) -> None:
+        await ts.blacklist_token("jti-bl", int(time.time()) + 3600)
+        blacklisted, _ = await ts.check_and_lock_refresh("jti-bl")
+        assert blacklisted is True
@@ -1,13 +1,22 @@
 """Unit tests for web search tool."""
 
+from collections.abc import Iterator
 from unittest.mock import MagicMock, patch
 
-from app.tools.web_search import web_search
+import pytest
+
+from app.tools.web_search import _get_search, web_search
 
 
 class TestWebSearchTool:
     """Tests for web_search tool."""
 
+    @pytest.fixture(autouse=True)
+    def _reset_search(self) -> Iterator[None]:
+        _get_search.cache_clear()
+        yield
+        _get_search.cache_clear()
+
     def test_web_search_is_tool(self) -> None:
         """Test that web_search is a LangChain tool."""
         assert hasattr(web_search, "invoke")
@@ -63,3 +72,17 @@ class TestWebSearchTool:
         web_search.invoke("test query")
 
         mock_search_class.assert_called_once_with(num_results=5)
+
+    @patch("app.tools.web_search.DuckDuckGoSearchResults")
+    def test_web_search_reuses_instance(
+        self,
+        mock_search_class: MagicMock,
+    ) -> None:
+        """Test that the search wrapper is built once across calls."""
+        mock_search_class.return_value.invoke.return_value = "[]"
+
+        web_search.invoke("first")
+        web_search.invoke("second")
+
+        mock_search_class.assert_called_once_with(num_results=5)
+        assert mock_search_class.return_value.invoke.call_count == 2